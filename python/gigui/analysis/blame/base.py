@@ -6,8 +6,6 @@ including git blame command execution and basic blame data management.
 
 from pathlib import Path
 
-from git import Repo as GitRepo
-
 from gigui.analysis.blame.models import Blame
 from gigui.core.repository import RepoBase
 from gigui.typedefs import SHA, Author, BlameStr, FileStr
@@ -141,8 +139,8 @@ class RepoBlameBase(RepoBase):
     ) -> BlameStr:
         """Execute the actual git blame command.
 
-        Handles thread safety by creating separate GitRepo instances for
-        multithreaded operations.
+        Handles thread safety by using a separate GitRepo instance per worker
+        thread for multithreaded operations.
 
         Args:
             start_sha: Starting commit SHA
@@ -157,9 +155,10 @@ class RepoBlameBase(RepoBase):
 
         """
         # Get file string for the specific SHA
-        fstr = self.get_fstr_for_sha(root_fstr, start_sha)
+        start_nr = self.sha2nr.get(start_sha, 0)
+        fstr = self.get_fstr_for_sha_nr(root_fstr, start_nr)
         if not fstr:
-            msg = f"File {root_fstr} not found at {start_sha}, number {self.sha2nr[start_sha]}."
+            msg = f"File {root_fstr} not found at {start_sha}, number {start_nr}."
             raise ValueError(
                 msg
             )
@@ -169,12 +168,10 @@ class RepoBlameBase(RepoBase):
 
         # Handle thread safety for multithreaded operations
         if getattr(self.args, "multithread", False):
-            # GitPython is not thread-safe, create new GitRepo instance
-            git_repo = GitRepo(self.location)
-            blame_str = git_repo.git.blame(
+            # GitPython is not thread-safe, use the GitRepo instance of this thread
+            blame_str = self.get_thread_git_repo().git.blame(
                 start_oid, fstr, "--follow", "--porcelain", *blame_opts
             )  # type: ignore
-            git_repo.close()
         else:
             blame_str = self.git_repo.git.blame(
                 start_oid, fstr, "--follow", "--porcelain", *blame_opts
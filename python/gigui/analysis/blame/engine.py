@@ -30,7 +30,8 @@ class RepoBlame(RepoBlameBase):
         based on configuration. Updates the person database with newly discovered
         authors and normalizes author names.
         """
-        i_max: int = len(self.fstrs)
+        fstrs: list[FileStr] = self.fstrs
+        i_max: int = len(fstrs)
         i: int = 0
         chunk_size: int = BLAME_CHUNK_SIZE
 
@@ -41,7 +42,7 @@ class RepoBlame(RepoBlameBase):
             with ThreadPoolExecutor(max_workers=MAX_THREAD_WORKERS) as thread_executor:
                 for chunk_start in range(0, i_max, chunk_size):
                     chunk_end = min(chunk_start + chunk_size, i_max)
-                    chunk_fstrs = self.fstrs[chunk_start:chunk_end]
+                    chunk_fstrs = fstrs[chunk_start:chunk_end]
 
                     # Submit blame tasks for the chunk
                     futures = [
@@ -55,9 +56,10 @@ class RepoBlame(RepoBlameBase):
                     for future in as_completed(futures):
                         fstr, blames = future.result()
                         self.fstr2blames[fstr] = blames
+            self.close_thread_git_repos()
         else:
             # Single-threaded processing
-            for fstr in self.fstrs:
+            for fstr in fstrs:
                 fstr, blames = self.get_blames_for(fstr, self.head_sha, i, i_max)
                 self.fstr2blames[fstr] = blames
                 i += 1
@@ -10,7 +10,7 @@ from datetime import datetime
 from gigui.typedefs import OID, SHA, Author, Email, FileStr
 
 
-@dataclass
+@dataclass(slots=True)
 class LineData:
     """Data for a single line in blame output.
 
@@ -31,7 +31,7 @@ class LineData:
     is_comment: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Blame:
     """Blame information for lines of code with complete metadata.
 
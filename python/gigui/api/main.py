@@ -16,9 +16,11 @@ import json
 import logging
 import sys
 import time
-from dataclasses import asdict, dataclass
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, fields, is_dataclass
 from math import floor
 from pathlib import Path
+from typing import Any
 
 from gigui.api.types import (
     AnalysisResult,
@@ -48,7 +50,7 @@ DAYS_IN_MONTH = 30.44
 from gigui.core.legacy_engine import LegacyEngineWrapper
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitGroup:
     """A CommitGroup holds the sum of commit data for commits that share the same person author and file name."""
 
@@ -63,6 +65,17 @@ class CommitGroup:
 class Stat:
     """Statistics for commits, insertions, deletions, and blame data."""
 
+    __slots__ = (
+        "blame_line_count",
+        "date_sum",
+        "deletions",
+        "insertions",
+        "percent_deletions",
+        "percent_insertions",
+        "percent_lines",
+        "shas",
+    )
+
     def __init__(self) -> None:
         self.shas: set[SHA] = (
             set()
@@ -585,74 +598,7 @@ class GitInspectorAPI:
                 )
             logger.debug("Settings validation passed")
 
-            # Configure Person class with enhanced filtering settings (for backward compatibility)
-            logger.debug("Configuring Person class with settings")
-            Person.configure_from_settings(settings)
-
-            # Fix working directory issue: resolve relative paths correctly
-            # When server runs from python/ directory, "." refers to python/, not project root
-            # We need to resolve paths relative to the project root, not current working directory
-            import os
-            from pathlib import Path
-
-            logger.debug("Resolving repository paths")
-
-            # Find the project root (directory containing .git)
-            current_dir = Path.cwd()
-            project_root = current_dir
-
-            # Search upward for .git directory
-            while project_root != project_root.parent:
-                if (project_root / ".git").exists():
-                    break
-                project_root = project_root.parent
-            else:
-                # If no .git found, check if current directory has .git
-                if not (current_dir / ".git").exists():
-                    # Try using the parent of python directory if we're in python/
-                    if current_dir.name == "python":
-                        project_root = current_dir.parent
-                    else:
-                        project_root = current_dir
-
-            logger.info(f"Resolved project root: {project_root}")
-            logger.info(f"Current working directory: {current_dir}")
-
-            # Resolve input paths relative to project root
-            resolved_paths = []
-            for path_str in settings.input_fstrs:
-                if path_str == ".":
-                    # "." should refer to project root, not current working directory
-                    resolved_path = str(project_root)
-                elif not os.path.isabs(path_str):
-                    # Relative paths should be relative to project root
-                    resolved_path = str(project_root / path_str)
-                else:
-                    # Absolute paths remain unchanged
-                    resolved_path = path_str
-
-                resolved_paths.append(resolved_path)
-                logger.info(f"Resolved path: {path_str} -> {resolved_path}")
-
-                # Validate that the resolved path exists and is a git repository
-                resolved_path_obj = Path(resolved_path)
-                if not resolved_path_obj.exists():
-                    logger.error(f"Repository path does not exist: {resolved_path}")
-                elif (
-                    not (resolved_path_obj / ".git").exists()
-                    and not (resolved_path_obj / ".git").is_file()
-                ):
-                    logger.warning(f"Path is not a git repository: {resolved_path}")
-                else:
-                    logger.debug(f"Repository path validated: {resolved_path}")
-
-            # Update settings with resolved paths
-            settings.input_fstrs = resolved_paths
-            logger.debug(f"Updated settings with {len(resolved_paths)} resolved paths")
-
-            # Normalize paths for cross-platform compatibility
-            logger.debug("Normalizing paths for cross-platform compatibility")
-            settings.normalize_paths()
+            self._prepare_settings(settings)
 
             # Delegate to the sophisticated legacy engine
             logger.info("=== DELEGATING TO LEGACY ENGINE WRAPPER ===")
@@ -723,6 +669,115 @@ class GitInspectorAPI:
                 error=f"API analysis execution failed: {e}",
             )
 
+    def _prepare_settings(self, settings: Settings) -> None:
+        """Prepare validated settings for the legacy engine.
+
+        Configures the Person class and resolves and normalizes the input paths
+        of the settings in place.
+
+        Args:
+            settings: Enhanced GUI settings object
+
+        """
+        # Configure Person class with enhanced filtering settings (for backward compatibility)
+        logger.debug("Configuring Person class with settings")
+        Person.configure_from_settings(settings)
+
+        # Fix working directory issue: resolve relative paths correctly
+        # When server runs from python/ directory, "." refers to python/, not project root
+        # We need to resolve paths relative to the project root, not current working directory
+        import os
+        from pathlib import Path
+
+        logger.debug("Resolving repository paths")
+
+        # Find the project root (directory containing .git)
+        current_dir = Path.cwd()
+        project_root = current_dir
+
+        # Search upward for .git directory
+        while project_root != project_root.parent:
+            if (project_root / ".git").exists():
+                break
+            project_root = project_root.parent
+        else:
+            # If no .git found, check if current directory has .git
+            if not (current_dir / ".git").exists():
+                # Try using the parent of python directory if we're in python/
+                if current_dir.name == "python":
+                    project_root = current_dir.parent
+                else:
+                    project_root = current_dir
+
+        logger.info(f"Resolved project root: {project_root}")
+        logger.info(f"Current working directory: {current_dir}")
+
+        # Resolve input paths relative to project root
+        resolved_paths = []
+        for path_str in settings.input_fstrs:
+            if path_str == ".":
+                # "." should refer to project root, not current working directory
+                resolved_path = str(project_root)
+            elif not os.path.isabs(path_str):
+                # Relative paths should be relative to project root
+                resolved_path = str(project_root / path_str)
+            else:
+                # Absolute paths remain unchanged
+                resolved_path = path_str
+
+            resolved_paths.append(resolved_path)
+            logger.info(f"Resolved path: {path_str} -> {resolved_path}")
+
+            # Validate that the resolved path exists and is a git repository
+            resolved_path_obj = Path(resolved_path)
+            if not resolved_path_obj.exists():
+                logger.error(f"Repository path does not exist: {resolved_path}")
+            elif (
+                not (resolved_path_obj / ".git").exists()
+                and not (resolved_path_obj / ".git").is_file()
+            ):
+                logger.warning(f"Path is not a git repository: {resolved_path}")
+            else:
+                logger.debug(f"Repository path validated: {resolved_path}")
+
+        # Update settings with resolved paths
+        settings.input_fstrs = resolved_paths
+        logger.debug(f"Updated settings with {len(resolved_paths)} resolved paths")
+
+        # Normalize paths for cross-platform compatibility
+        logger.debug("Normalizing paths for cross-platform compatibility")
+        settings.normalize_paths()
+
+    def execute_analysis_stream(self, settings: Settings) -> Iterator[AnalysisResult]:
+        """Execute the analysis one repository at a time.
+
+        The settings are prepared, validated and translated once, after which the
+        engine yields the result of each repository as soon as it is ready, so
+        that a client can show the first repositories while later ones are still
+        being analyzed, and only one repository result is held at a time.
+
+        Args:
+            settings: Enhanced GUI settings object
+
+        Yields:
+            AnalysisResult holding a single repository, or its error
+
+        """
+        logger.info("API streaming analysis using Legacy Engine Wrapper")
+        try:
+            self._prepare_settings(settings)
+        except Exception as e:
+            logger.exception(f"API analysis preparation failed: {e}")
+            yield AnalysisResult(
+                repositories=[],
+                success=False,
+                error=f"API analysis execution failed: {e}",
+            )
+            return
+
+        yield from self.engine.execute_analysis_stream(settings)
+        self._analysis_count += 1
+
     def get_engine_info(self) -> dict:
         """Get information about the analysis engine capabilities.
 
@@ -772,6 +827,31 @@ class GitInspectorAPI:
         }
 
 
+def dataclass_to_json(obj: Any) -> str:
+    """Serialize a dataclass tree to compact JSON.
+
+    Gives the same JSON as ``json.dumps(asdict(obj))`` without first
+    deep-copying the whole tree into dicts: nested dataclasses are expanded
+    one level at a time by the C encoder, which matters for the multi-MB
+    results of execute_analysis.
+
+    Args:
+        obj: Dataclass instance, e.g. an AnalysisResult
+
+    Returns:
+        JSON string without whitespace between tokens
+
+    """
+
+    def expand(value: Any) -> dict[str, Any]:
+        if is_dataclass(value) and not isinstance(value, type):
+            return {f.name: getattr(value, f.name) for f in fields(value)}
+        msg = f"Object of type {type(value).__name__} is not JSON serializable"
+        raise TypeError(msg)
+
+    return json.dumps(obj, default=expand, separators=(",", ":"))
+
+
 def main() -> None:
     """Main entry point for command-line usage."""
     if len(sys.argv) < 2:
@@ -836,10 +916,10 @@ def main() -> None:
             api.save_settings(settings)
             print(json.dumps({"success": True}))
 
-        elif command == "execute_analysis":
+        elif command in {"execute_analysis", "execute_analysis_stream"}:
             if len(sys.argv) < 3:
                 print(
-                    "Usage: python api.py execute_analysis <settings_json>",
+                    f"Usage: python api.py {command} <settings_json>",
                     file=sys.stderr,
                 )
                 sys.exit(1)
@@ -883,8 +963,13 @@ def main() -> None:
                     settings_data[key] = default_value
 
             settings = Settings(**settings_data)
-            result = api.execute_analysis(settings)
-            print(json.dumps(asdict(result)))
+            if command == "execute_analysis_stream":
+                # NDJSON: one line per repository, flushed as soon as it is ready
+                for result in api.execute_analysis_stream(settings):
+                    print(dataclass_to_json(result), flush=True)
+            else:
+                result = api.execute_analysis(settings)
+                print(dataclass_to_json(result))
 
         elif command == "get_engine_info":
             engine_info = api.get_engine_info()
@@ -4,9 +4,25 @@ This module contains the data classes used by both the API and Legacy Engine
 to avoid circular import issues.
 """
 
-from dataclasses import dataclass
+from dataclasses import MISSING, dataclass, field, fields
 from pathlib import Path
 
+DEFAULT_EXTENSIONS = (
+    "c",
+    "cc",
+    "cif",
+    "cpp",
+    "glsl",
+    "h",
+    "hh",
+    "hpp",
+    "java",
+    "js",
+    "py",
+    "rb",
+    "sql",
+    "ts",
+)
 
 @dataclass
 class AuthorStat:
@@ -34,9 +50,12 @@ class FileStat:
     percentage: float
 
 
-@dataclass
+@dataclass(slots=True)
 class BlameEntry:
-    """A single blame entry."""
+    """A single blame entry.
+
+    Uses __slots__ because one instance is created per blamed line.
+    """
 
     file: str
     line_number: int
@@ -77,22 +96,23 @@ class Settings:
 
     # File Analysis Settings
     n_files: int = 5
-    include_files: list[str] = None
-    ex_files: list[str] = None
-    extensions: list[str] = None
+    include_files: list[str] = field(default_factory=list)
+    ex_files: list[str] = field(default_factory=list)
+    extensions: list[str] = field(default_factory=lambda: list(DEFAULT_EXTENSIONS))
 
     # Author and Commit Filtering
-    ex_authors: list[str] = None
-    ex_emails: list[str] = None
-    ex_revisions: list[str] = None
-    ex_messages: list[str] = None
+    ex_authors: list[str] = field(default_factory=list)
+    ex_emails: list[str] = field(default_factory=list)
+    ex_revisions: list[str] = field(default_factory=list)
+    ex_messages: list[str] = field(default_factory=list)
     since: str = ""
     until: str = ""
 
     # Output and Format Settings
     outfile_base: str = "gitinspect"
     fix: str = "prefix"  # Options: "prefix", "postfix", "nofix"
-    file_formats: list[str] = None  # Options: ["html", "excel"]
+    # Options: ["html", "excel"]
+    file_formats: list[str] = field(default_factory=lambda: ["html"])
     view: str = "auto"  # Options: "auto", "dynamic-blame-history", "none"
 
     # Analysis Options
@@ -129,11 +149,12 @@ class Settings:
     follow_renames: bool = True  # Follow file renames in git history
     ignore_merge_commits: bool = False  # Skip merge commits in analysis
 
-    # Advanced Filtering Options - Pattern-based exclusions
-    ex_author_patterns: list[str] = None  # Glob patterns for author exclusion
-    ex_email_patterns: list[str] = None  # Glob patterns for email exclusion
-    ex_message_patterns: list[str] = None  # Glob patterns for commit message exclusion
-    ex_file_patterns: list[str] = None  # Advanced file exclusion patterns
+    # Advanced Filtering Options - Glob patterns for author, email, commit
+    # message and file exclusion
+    ex_author_patterns: list[str] = field(default_factory=list)
+    ex_email_patterns: list[str] = field(default_factory=list)
+    ex_message_patterns: list[str] = field(default_factory=list)
+    ex_file_patterns: list[str] = field(default_factory=list)
 
     # Ignore-revs File Support (like .git-blame-ignore-revs)
     ignore_revs_file: str = ""  # Path to ignore-revs file
@@ -186,51 +207,15 @@ class Settings:
     preserve_legacy_output_format: bool = False  # Preserve exact legacy output format
 
     def __post_init__(self):
-        """Initialize empty lists for None values and validate settings."""
-        # Basic file and extension settings
-        if self.include_files is None:
-            self.include_files = []
-        if self.ex_files is None:
-            self.ex_files = []
-        if self.extensions is None:
-            self.extensions = [
-                "c",
-                "cc",
-                "cif",
-                "cpp",
-                "glsl",
-                "h",
-                "hh",
-                "hpp",
-                "java",
-                "js",
-                "py",
-                "rb",
-                "sql",
-                "ts",
-            ]
-        if self.file_formats is None:
-            self.file_formats = ["html"]
-
-        # Basic exclusion settings
-        if self.ex_authors is None:
-            self.ex_authors = []
-        if self.ex_emails is None:
-            self.ex_emails = []
-        if self.ex_revisions is None:
-            self.ex_revisions = []
-        if self.ex_messages is None:
-            self.ex_messages = []
-
-        # Advanced pattern-based exclusion settings
-        if self.ex_author_patterns is None:
-            self.ex_author_patterns = []
-        if self.ex_email_patterns is None:
-            self.ex_email_patterns = []
-        if self.ex_message_patterns is None:
-            self.ex_message_patterns = []
-        if self.ex_file_patterns is None:
-            self.ex_file_patterns = []
+        """Initialize list settings passed as None and validate settings."""
+        # List settings explicitly passed as None, e.g. from JSON null values,
+        # get the value of their default factory
+        for setting in fields(self):
+            if (
+                setting.default_factory is not MISSING
+                and getattr(self, setting.name) is None
+            ):
+                setattr(self, setting.name, setting.default_factory())
 
         # Validation of numeric settings
         if not self.n_files >= 0:
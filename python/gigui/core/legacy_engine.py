@@ -20,13 +20,24 @@ Classes:
 """
 
 import contextlib
+import copy
 import logging
+import posixpath
+import sys
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
 import psutil
+from git import GitError
+from git import Repo as GitRepo
 
 from gigui.api.types import (
     AnalysisResult,
@@ -36,15 +47,65 @@ from gigui.api.types import (
     RepositoryResult,
     Settings,
 )
-from gigui.common import format_bytes, safe_divide, validate_file_path
+from gigui.common import safe_divide, validate_file_path
 from gigui.core.orchestrator import RepoData
-from gigui.core.statistics import IniRepo
+from gigui.core.statistics import IniRepo, Stat
 from gigui.performance_monitor import profiler
+from gigui.typedefs import OID, Author
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+MAX_VALIDATION_WORKERS = 8
+VALID_PATH_CACHE_SIZE = 64  # successful path validations kept per session
+VALID_PATH_TTL = 5.0  # seconds a successful path validation is reused
+TRANSLATION_CACHE_SIZE = 8  # settings translations kept per session
+MEMORY_SAMPLE_INTERVAL = 0.1  # seconds
+BYTES_PER_MB = 1024 * 1024
+RESULT_CACHE_SIZE = 8  # analysis results kept per session
+# Working tree files that change the analysis of an unchanged HEAD commit: the
+# mailmap maps author names in git log, the ignore-revs file is used by blame
+RESULT_CACHE_WORKTREE_FILES = (".mailmap", "_git-blame-ignore-revs.txt")
+
+# Modification time and size of a file, or None if it does not exist
+type FileSignature = tuple[int, int] | None
+# Per repository, the analyzed HEAD commit and the signatures of the working
+# tree files that the analysis reads
+type RepoStates = tuple[tuple[OID, tuple[FileSignature, ...]], ...]
+
+# Static engine description, built once; its tuples are returned as lists
+ENGINE_INFO: dict[str, Any] = {
+    "engine_name": "GitInspectorGUI Legacy Analysis Engine",
+    "version": "4.0.0",
+    "capabilities": (
+        "Advanced person identity merging",
+        "Sophisticated statistics calculation",
+        "Comprehensive blame analysis",
+        "Performance-optimized git operations",
+        "Pattern-based filtering",
+        "Memory management",
+        "Multi-threading support",
+        "Cross-platform compatibility",
+    ),
+    "supported_formats": ("html", "excel"),
+    "supported_repositories": ("git",),
+    "performance_features": (
+        "Configurable threading",
+        "Memory limits",
+        "Chunked processing",
+        "Garbage collection optimization",
+    ),
+    "filtering_features": (
+        "Author patterns (glob/regex)",
+        "Email patterns (glob/regex)",
+        "Message patterns (glob/regex)",
+        "File patterns (glob/regex)",
+        "Ignore-revs file support",
+        "Date range filtering",
+    ),
+}
+
+
+@dataclass(slots=True, frozen=True)
 class PerformanceMetrics:
     """Performance metrics for analysis operations."""
 
@@ -68,6 +129,140 @@ class PerformanceMetrics:
         return safe_divide(self.total_commits, self.duration_seconds, 0.0)
 
 
+# Settings fields copied to LegacyArgs, with the fallback expression used when the
+# settings value is empty, or None to copy the value as is.
+LEGACY_ARG_FIELDS: tuple[tuple[str, str | None], ...] = (
+    # Repository and Input Settings
+    ("input_fstrs", None),
+    ("depth", None),
+    ("subfolder", None),
+    # File Analysis Settings
+    ("n_files", None),
+    ("include_files", None),
+    ("ex_files", None),
+    ("extensions", None),
+    # Author and Commit Filtering
+    ("ex_authors", None),
+    ("ex_emails", None),
+    ("ex_revisions", None),
+    ("ex_messages", None),
+    ("since", None),
+    ("until", None),
+    # Advanced Pattern-based Filtering
+    ("ex_author_patterns", None),
+    ("ex_email_patterns", None),
+    ("ex_message_patterns", None),
+    ("ex_file_patterns", None),
+    # Output and Format Settings
+    ("outfile_base", None),
+    ("fix", None),
+    ("file_formats", '["html"]'),
+    ("view", None),
+    # Analysis Options
+    ("copy_move", None),
+    ("scaled_percentages", None),
+    ("blame_exclusions", None),
+    ("blame_skip", None),
+    ("show_renames", None),
+    # Content Analysis
+    ("deletions", None),
+    ("whitespace", None),
+    ("empty_lines", None),
+    ("comments", None),
+    # Performance Settings
+    ("multithread", None),
+    ("multicore", None),
+    ("verbosity", None),
+    ("max_thread_workers", None),
+    ("git_log_chunk_size", None),
+    ("blame_chunk_size", None),
+    ("max_core_workers", None),
+    # Memory Management
+    ("memory_limit_mb", None),
+    ("enable_gc_optimization", None),
+    ("max_file_size_kb", None),
+    # Repository Analysis Controls
+    ("max_commit_count", None),
+    ("follow_renames", None),
+    ("ignore_merge_commits", None),
+    # Ignore-revs File Support
+    ("ignore_revs_file", None),
+    ("enable_ignore_revs", None),
+    # Blame Analysis Configuration
+    ("blame_follow_moves", None),
+    ("blame_ignore_whitespace", None),
+    ("blame_minimal_context", None),
+    ("blame_show_email", None),
+    # Output Format Options
+    ("output_encoding", None),
+    ("date_format", None),
+    ("author_display_format", None),
+    ("line_number_format", None),
+    # Excel-specific Options
+    ("excel_max_rows", None),
+    ("excel_abbreviate_names", None),
+    ("excel_freeze_panes", None),
+    # HTML-specific Options
+    ("html_theme", None),
+    ("html_enable_search", None),
+    ("html_max_entries_per_page", None),
+    # Web Server Options
+    ("server_port", None),
+    ("server_host", None),
+    ("max_browser_tabs", None),
+    ("auto_open_browser", None),
+    # Development/Testing
+    ("dryrun", None),
+    ("profile", None),
+    # Debug and Logging
+    ("debug_show_main_event_loop", None),
+    ("debug_multiprocessing", None),
+    ("debug_git_commands", None),
+    ("log_git_output", None),
+    # GUI-specific
+    ("gui_settings_full_path", None),
+    ("col_percent", None),
+    # Legacy Compatibility
+    ("legacy_mode", None),
+    ("preserve_legacy_output_format", None),
+)
+
+
+class LegacyArgs:
+    """Legacy Args-compatible object holding the translated settings.
+
+    Has a slot for each field of LEGACY_ARG_FIELDS and no instance dictionary.
+    """
+
+    __slots__ = tuple(name for name, _ in LEGACY_ARG_FIELDS)
+
+
+def _build_translator() -> Callable[[Settings], LegacyArgs]:
+    """Generate a function that copies Settings fields to a new LegacyArgs object.
+
+    The function is generated once from LEGACY_ARG_FIELDS, so that each
+    translation is a sequence of plain attribute copies instead of building an
+    intermediate dictionary and setting attributes in a loop.
+
+    Returns:
+        Function translating a Settings object into a LegacyArgs object
+
+    """
+    lines = ["def translate(settings):", "    args = LegacyArgs()"]
+    for name, fallback in LEGACY_ARG_FIELDS:
+        value = f"settings.{name}"
+        if fallback is not None:
+            value += f" or {fallback}"
+        lines.append(f"    args.{name} = {value}")
+    lines.append("    return args")
+    namespace: dict[str, Any] = {"LegacyArgs": LegacyArgs}
+    exec("\n".join(lines), namespace)  # noqa: S102
+    return namespace["translate"]
+
+
+_translate = _build_translator()
+
+
 class SettingsTranslator:
     """Translates GUI Settings to legacy Args format.
 
@@ -89,137 +284,25 @@ class SettingsTranslator:
             IniRepo object configured for legacy analysis engine
 
         Raises:
-            ValueError: If settings validation fails
-            TypeError: If settings contain invalid types
+            ValueError: If no input repositories are specified
 
         """
-        try:
-            # Validate input settings
-            if not settings.input_fstrs:
-                msg = "No input repositories specified"
-                raise ValueError(msg)
-
-            # Create legacy Args-compatible dictionary
-            legacy_args = {
-                # Repository and Input Settings
-                "input_fstrs": settings.input_fstrs,
-                "depth": settings.depth,
-                "subfolder": settings.subfolder,
-                # File Analysis Settings
-                "n_files": settings.n_files,
-                "include_files": settings.include_files or [],
-                "ex_files": settings.ex_files or [],
-                "extensions": settings.extensions or [],
-                # Author and Commit Filtering
-                "ex_authors": settings.ex_authors or [],
-                "ex_emails": settings.ex_emails or [],
-                "ex_revisions": settings.ex_revisions or [],
-                "ex_messages": settings.ex_messages or [],
-                "since": settings.since,
-                "until": settings.until,
-                # Advanced Pattern-based Filtering
-                "ex_author_patterns": settings.ex_author_patterns or [],
-                "ex_email_patterns": settings.ex_email_patterns or [],
-                "ex_message_patterns": settings.ex_message_patterns or [],
-                "ex_file_patterns": settings.ex_file_patterns or [],
-                # Output and Format Settings
-                "outfile_base": settings.outfile_base,
-                "fix": settings.fix,
-                "file_formats": settings.file_formats or ["html"],
-                "view": settings.view,
-                # Analysis Options
-                "copy_move": settings.copy_move,
-                "scaled_percentages": settings.scaled_percentages,
-                "blame_exclusions": settings.blame_exclusions,
-                "blame_skip": settings.blame_skip,
-                "show_renames": settings.show_renames,
-                # Content Analysis
-                "deletions": settings.deletions,
-                "whitespace": settings.whitespace,
-                "empty_lines": settings.empty_lines,
-                "comments": settings.comments,
-                # Performance Settings
-                "multithread": settings.multithread,
-                "multicore": settings.multicore,
-                "verbosity": settings.verbosity,
-                "max_thread_workers": settings.max_thread_workers,
-                "git_log_chunk_size": settings.git_log_chunk_size,
-                "blame_chunk_size": settings.blame_chunk_size,
-                "max_core_workers": settings.max_core_workers,
-                # Memory Management
-                "memory_limit_mb": settings.memory_limit_mb,
-                "enable_gc_optimization": settings.enable_gc_optimization,
-                "max_file_size_kb": settings.max_file_size_kb,
-                # Repository Analysis Controls
-                "max_commit_count": settings.max_commit_count,
-                "follow_renames": settings.follow_renames,
-                "ignore_merge_commits": settings.ignore_merge_commits,
-                # Ignore-revs File Support
-                "ignore_revs_file": settings.ignore_revs_file,
-                "enable_ignore_revs": settings.enable_ignore_revs,
-                # Blame Analysis Configuration
-                "blame_follow_moves": settings.blame_follow_moves,
-                "blame_ignore_whitespace": settings.blame_ignore_whitespace,
-                "blame_minimal_context": settings.blame_minimal_context,
-                "blame_show_email": settings.blame_show_email,
-                # Output Format Options
-                "output_encoding": settings.output_encoding,
-                "date_format": settings.date_format,
-                "author_display_format": settings.author_display_format,
-                "line_number_format": settings.line_number_format,
-                # Excel-specific Options
-                "excel_max_rows": settings.excel_max_rows,
-                "excel_abbreviate_names": settings.excel_abbreviate_names,
-                "excel_freeze_panes": settings.excel_freeze_panes,
-                # HTML-specific Options
-                "html_theme": settings.html_theme,
-                "html_enable_search": settings.html_enable_search,
-                "html_max_entries_per_page": settings.html_max_entries_per_page,
-                # Web Server Options
-                "server_port": settings.server_port,
-                "server_host": settings.server_host,
-                "max_browser_tabs": settings.max_browser_tabs,
-                "auto_open_browser": settings.auto_open_browser,
-                # Development/Testing
-                "dryrun": settings.dryrun,
-                "profile": settings.profile,
-                # Debug and Logging
-                "debug_show_main_event_loop": settings.debug_show_main_event_loop,
-                "debug_multiprocessing": settings.debug_multiprocessing,
-                "debug_git_commands": settings.debug_git_commands,
-                "log_git_output": settings.log_git_output,
-                # GUI-specific
-                "gui_settings_full_path": settings.gui_settings_full_path,
-                "col_percent": settings.col_percent,
-                # Legacy Compatibility
-                "legacy_mode": settings.legacy_mode,
-                "preserve_legacy_output_format": settings.preserve_legacy_output_format,
-            }
-
-            # Create a simple args object from the dictionary
-            class Args:
-                def __init__(self, **kwargs) -> None:
-                    for key, value in kwargs.items():
-                        setattr(self, key, value)
-
-            args_obj = Args(**legacy_args)
-
-            # Create IniRepo with the first repository path
-            primary_repo_path = settings.input_fstrs[0]
-            repo_path = Path(primary_repo_path)
-            ini_repo = IniRepo(name=repo_path.name, location=repo_path, args=args_obj)
-
-            logger.info(f"Translated settings for repository: {primary_repo_path}")
-            logger.debug(f"Legacy args created with {len(legacy_args)} parameters")
+        if not settings.input_fstrs:
+            msg = "No input repositories specified"
+            raise ValueError(msg)
 
-            return ini_repo
+        # Copy settings to a legacy Args-compatible object
+        args_obj = _translate(settings)
 
-        except Exception as e:
-            logger.exception(f"Settings translation failed: {e}")
-            msg = f"Failed to translate settings to legacy format: {e}"
-            raise ValueError(
-                msg
-            ) from e
+        # Create IniRepo with the first repository path
+        primary_repo_path = settings.input_fstrs[0]
+        repo_path = Path(primary_repo_path)
+        ini_repo = IniRepo(name=repo_path.name, location=repo_path, args=args_obj)
+
+        logger.info("Translated settings for repository: %s", primary_repo_path)
+        logger.debug("Legacy args created with %d parameters", len(LEGACY_ARG_FIELDS))
+
+        return ini_repo
 
 
 class ResultConverter:
@@ -230,157 +313,160 @@ class ResultConverter:
     """
 
     @staticmethod
-    def convert_repo_data_to_analysis_result(
-        repo_data_list: list[RepoData],
-        settings: Settings,
-        performance_metrics: PerformanceMetrics,
-    ) -> AnalysisResult:
-        """Convert legacy RepoData objects to GUI AnalysisResult format.
-
-        Transforms the sophisticated legacy analysis results into the format
-        expected by the current frontend while preserving all statistical data.
+    def convert_one(
+        repo_data: RepoData, settings: Settings, *, sort: bool = True
+    ) -> RepositoryResult:
+        """Convert a single legacy RepoData object to a GUI RepositoryResult.
 
         Args:
-            repo_data_list: List of RepoData objects from legacy analysis
+            repo_data: Analyzed repository data
             settings: Original settings used for analysis
-            performance_metrics: Performance metrics from analysis
+            sort: Whether to order authors by insertions and files by lines
 
         Returns:
-            AnalysisResult object compatible with current GUI
-
-        Raises:
-            ValueError: If conversion fails due to invalid data
+            RepositoryResult with the authors, files and blame data of the repository
 
         """
-        try:
-            repositories = []
-
-            for repo_data in repo_data_list:
-                # Convert authors from legacy format
-                authors = ResultConverter._convert_authors(repo_data)
+        # Convert authors, files and blame data from legacy format
+        authors, files, blame_data = ResultConverter._convert_all(
+            repo_data, sort=sort, blame=not settings.blame_skip
+        )
 
-                # Convert files from legacy format
-                files = ResultConverter._convert_files(repo_data)
+        logger.info("Converted repository: %s", repo_data.path.name)
+        logger.debug(
+            "  Authors: %d, Files: %d, Blame entries: %d",
+            len(authors),
+            len(files),
+            len(blame_data),
+        )
 
-                # Convert blame data from legacy format
-                blame_data = ResultConverter._convert_blame_data(repo_data)
+        return RepositoryResult(
+            name=repo_data.path.name,
+            path=str(repo_data.path),
+            authors=authors,
+            files=files,
+            blame_data=blame_data,
+        )
 
-                # Create repository result
-                repo_result = RepositoryResult(
-                    name=repo_data.path.name,
-                    path=str(repo_data.path),
-                    authors=authors,
-                    files=files,
-                    blame_data=blame_data,
-                )
+    @staticmethod
+    def _convert_all(
+        repo_data: RepoData, *, sort: bool = False, blame: bool = True
+    ) -> tuple[list[AuthorStat], list[FileStat], list[BlameEntry]]:
+        """Convert legacy author, file and blame data of a repository to GUI format.
 
-                repositories.append(repo_result)
+        The number of files per author is read from the sizes of the per-author
+        file tables, so that the author conversion does not have to rescan them.
 
-                logger.info(f"Converted repository: {repo_data.path.name}")
-                logger.debug(
-                    f"  Authors: {len(authors)}, Files: {len(files)}, Blame entries: {len(blame_data)}"
-                )
+        Args:
+            repo_data: Analyzed repository data
+            sort: Whether to sort authors and files, see _convert_authors and
+                _convert_files
+            blame: Whether to convert blame data, otherwise it is left empty
 
-            return AnalysisResult(repositories=repositories, success=True, error=None)
+        Returns:
+            Tuple of (authors, files, blame_data)
 
-        except Exception as e:
-            logger.exception(f"Result conversion failed: {e}")
-            return AnalysisResult(
-                repositories=[],
-                success=False,
-                error=f"Failed to convert legacy results: {e}",
-            )
+        """
+        # Each per-author file table holds one "*" totals entry besides the files
+        author_file_counts = {
+            author: len(fstr2fstat) - ("*" in fstr2fstat)
+            for author, fstr2fstat in repo_data.author2fstr2fstat.items()
+        }
+        return (
+            ResultConverter._convert_authors(
+                repo_data, author_file_counts, sort=sort
+            ),
+            ResultConverter._convert_files(repo_data, sort=sort),
+            ResultConverter._convert_blame_data(repo_data) if blame else [],
+        )
 
     @staticmethod
-    def _convert_authors(repo_data: RepoData) -> list[AuthorStat]:
-        """Convert legacy author statistics to GUI format."""
-        authors = []
+    def _convert_authors(
+        repo_data: RepoData,
+        author_file_counts: dict[Author, int],
+        *,
+        sort: bool = False,
+    ) -> list[AuthorStat]:
+        """Convert legacy author statistics to GUI format.
+
+        Authors are sorted by insertions (descending) only when sort is True.
+        """
+        authors: list[AuthorStat] = []
 
         try:
-            # Get author statistics from legacy data
-            for author, pstat in repo_data.author2pstat.items():
-                if author == "*":  # Skip totals row
-                    continue
-
-                # Extract person information
-                person = pstat.person
-                stat = pstat.stat
-
-                # Get primary email
-                primary_email = (
-                    next(iter(person.emails)) if person.emails else "unknown@example.com"
-                )
-
-                # Get file count for this author from author2fstr2fstat
-                file_count = 0
-                if author in repo_data.author2fstr2fstat:
-                    # Count files (excluding "*" totals)
-                    file_count = len(
-                        [
-                            f
-                            for f in repo_data.author2fstr2fstat[author]
-                            if f != "*"
-                        ]
-                    )
+            # Person and statistics of each author, excluding the "*" totals row
+            rows = [
+                (author, pstat.person, pstat.stat)
+                for author, pstat in repo_data.author2pstat.items()
+                if author != "*"
+            ]
+            # Ages of all author rows in one batch
+            ages = Stat.ages(stat for _, _, stat in rows)
 
-                # Create AuthorStat
-                author_stat = AuthorStat(
+            # Get author statistics from legacy data
+            get_file_count = author_file_counts.get
+            authors = [
+                AuthorStat(
                     name=person.author,
-                    email=primary_email,
+                    email=next(iter(person.emails), "unknown@example.com"),
                     commits=len(stat.shas),
                     insertions=stat.insertions,
                     deletions=stat.deletions,
-                    files=file_count,
+                    files=get_file_count(author, 0),
                     percentage=round(stat.percent_insertions, 1),
-                    age=stat.age,
+                    age=age,
                 )
+                for (author, person, stat), age in zip(rows, ages, strict=True)
+            ]
 
-                authors.append(author_stat)
-
-            # Sort by insertions (descending)
-            authors.sort(key=lambda a: a.insertions, reverse=True)
+            if sort:
+                authors.sort(key=attrgetter("insertions"), reverse=True)
 
-            logger.debug(f"Converted {len(authors)} authors from legacy format")
+            logger.debug("Converted %d authors from legacy format", len(authors))
 
         except Exception as e:
-            logger.warning(f"Author conversion failed: {e}")
+            logger.warning("Author conversion failed: %s", e)
             # Return empty list on error
             authors = []
 
         return authors
 
     @staticmethod
-    def _convert_files(repo_data: RepoData) -> list[FileStat]:
-        """Convert legacy file statistics to GUI format."""
-        files = []
+    def _convert_files(repo_data: RepoData, *, sort: bool = False) -> list[FileStat]:
+        """Convert legacy file statistics to GUI format.
 
-        try:
-            # Get file statistics from legacy data
-            for fstr, fstat in repo_data.fstr2fstat.items():
-                if fstr == "*":  # Skip totals row
-                    continue
-
-                # Calculate file metrics
-                file_path = Path(fstr)
+        Files are sorted by lines (descending) only when sort is True.
+        """
+        files: list[FileStat] = []
 
-                file_stat = FileStat(
-                    name=file_path.name,
+        try:
+            # Get file statistics from legacy data, excluding the "*" totals row.
+            # Git paths always use "/" separators.
+            # Shared default for files without authors, instead of a new dict per
+            # file
+            fstr2author2fstat_get = repo_data.fstr2author2fstat.get
+            no_authors: dict[Author, object] = {}
+            files = [
+                FileStat(
+                    name=posixpath.basename(fstr),
                     path=str(fstr),
-                    lines=fstat.stat.blame_line_count,
-                    commits=len(fstat.stat.shas),
-                    authors=len(repo_data.fstr2author2fstat.get(fstr, {})),
-                    percentage=round(fstat.stat.percent_lines, 1),
+                    lines=stat.blame_line_count,
+                    commits=len(stat.shas),
+                    authors=len(fstr2author2fstat_get(fstr, no_authors)),
+                    percentage=round(stat.percent_lines, 1),
                 )
+                for fstr, fstat in repo_data.fstr2fstat.items()
+                if fstr != "*"
+                for stat in (fstat.stat,)
+            ]
 
-                files.append(file_stat)
-
-            # Sort by lines (descending)
-            files.sort(key=lambda f: f.lines, reverse=True)
+            if sort:
+                files.sort(key=attrgetter("lines"), reverse=True)
 
-            logger.debug(f"Converted {len(files)} files from legacy format")
+            logger.debug("Converted %d files from legacy format", len(files))
 
         except Exception as e:
-            logger.warning(f"File conversion failed: {e}")
+            logger.warning("File conversion failed: %s", e)
             # Return empty list on error
             files = []
 
@@ -389,36 +475,53 @@ class ResultConverter:
     @staticmethod
     def _convert_blame_data(repo_data: RepoData) -> list[BlameEntry]:
         """Convert legacy blame data to GUI format."""
-        blame_data = []
+        blame_data: list[BlameEntry] = []
 
         try:
-            # Use real blame data from fstr2blames
-            for fstr, blames in repo_data.fstr2blames.items():
-                if fstr == "*":  # Skip totals row
-                    continue
+            # Use real blame data from fstr2blames, skipping the totals row
+            fstr_blames = [
+                (str(fstr), blames)
+                for fstr, blames in repo_data.fstr2blames.items()
+                if fstr != "*"
+            ]
+
+            # Size the result up front so entries are stored by index
+            line_count = sum(
+                len(blame.line_datas)
+                for _, blames in fstr_blames
+                for blame in blames
+            )
+            blame_data = [None] * line_count  # type: ignore[list-item]
+
+            # Share one string object per unique author, sha and date
+            date_cache: dict[datetime, str] = {}
 
-                # Convert each blame entry to GUI format
+            i = 0
+            for fstr, blames in fstr_blames:
                 for blame in blames:
+                    author = sys.intern(blame.author)
+                    sha = sys.intern(blame.sha)  # Use real commit SHA
+                    date = date_cache.get(blame.date)  # Use real commit date
+                    if date is None:
+                        # isoformat() avoids strftime's locale-aware formatting
+                        date = date_cache[blame.date] = blame.date.isoformat()[:10]
                     for line_data in blame.line_datas:
-                        blame_entry = BlameEntry(
-                            file=str(fstr),
+                        blame_data[i] = BlameEntry(
+                            file=fstr,
                             line_number=line_data.line_nr,
-                            author=blame.author,
-                            commit=blame.sha,  # Use real commit SHA
-                            date=blame.date.strftime(
-                                "%Y-%m-%d"
-                            ),  # Use real commit date
+                            author=author,
+                            commit=sha,
+                            date=date,
                             content=line_data.line.strip(),  # Use real line content
                         )
-
-                        blame_data.append(blame_entry)
+                        i += 1
 
             logger.debug(
-                f"Converted {len(blame_data)} real blame entries from legacy format"
+                "Converted %d real blame entries from legacy format", len(blame_data)
             )
 
         except Exception as e:
-            logger.warning(f"Blame data conversion failed: {e}")
+            logger.warning("Blame data conversion failed: %s", e)
             # Return empty list on error
             blame_data = []
 
@@ -438,12 +541,26 @@ class PerformanceMonitor:
         self.end_time = 0.0
         self.initial_memory = 0.0
         self.peak_memory = 0.0
+        self._sampler: threading.Thread | None = None
+        self._stop_sampling = threading.Event()
+        # Created once, memory_info() then only reads the current usage
+        self._process = psutil.Process()
 
     def start_monitoring(self) -> None:
-        """Start performance monitoring."""
+        """Start performance monitoring.
+
+        Peak memory is sampled by a background thread, so that peaks reached
+        while a repository is being analyzed are also recorded.
+        """
+        self._stop_sampler()
         self.start_time = time.time()
         self.initial_memory = self._get_memory_usage()
         self.peak_memory = self.initial_memory
+        self._stop_sampling = threading.Event()
+        self._sampler = threading.Thread(
+            target=self._sample_memory, name="memory-sampler", daemon=True
+        )
+        self._sampler.start()
         logger.info("Performance monitoring started")
 
     def update_peak_memory(self) -> None:
@@ -461,6 +578,7 @@ class PerformanceMonitor:
     ) -> PerformanceMetrics:
         """Stop monitoring and return metrics."""
         self.end_time = time.time()
+        self._stop_sampler()
         self.update_peak_memory()
 
         metrics = PerformanceMetrics(
@@ -474,18 +592,32 @@ class PerformanceMonitor:
             errors_encountered=errors,
         )
 
-        logger.info(
-            f"Performance monitoring completed: {metrics.duration_seconds:.2f}s, "
-            f"{metrics.commits_per_second:.1f} commits/sec, "
-            f"{format_bytes(int(metrics.memory_usage_mb * 1024 * 1024))} peak memory"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Performance monitoring completed: %.2fs, %.1f commits/sec, "
+                "%.1f MiB peak memory",
+                metrics.duration_seconds,
+                metrics.commits_per_second,
+                metrics.memory_usage_mb,
+            )
 
         return metrics
 
+    def _sample_memory(self) -> None:
+        """Update peak memory usage periodically until sampling is stopped."""
+        while not self._stop_sampling.wait(MEMORY_SAMPLE_INTERVAL):
+            self.update_peak_memory()
+
+    def _stop_sampler(self) -> None:
+        """Stop the memory sampler thread, if running."""
+        if self._sampler is not None:
+            self._stop_sampling.set()
+            self._sampler.join()
+            self._sampler = None
+
     def _get_memory_usage(self) -> float:
         """Get current memory usage in MB."""
-        process = psutil.Process()
-        return process.memory_info().rss / 1024 / 1024  # Convert to MB
+        return self._process.memory_info().rss / BYTES_PER_MB
 
 
 class LegacyEngineWrapper:
@@ -502,6 +634,18 @@ class LegacyEngineWrapper:
         self.result_converter = ResultConverter()
         self.performance_monitor = PerformanceMonitor()
 
+        # Successful path validations with their time, and settings translations
+        # by settings repr, least recently used first. Failed validations are not
+        # cached and successful ones expire after VALID_PATH_TTL, so that a path
+        # that is created, moved or deleted is picked up.
+        self._valid_paths: OrderedDict[str, float] = OrderedDict()
+        self._translations: OrderedDict[str, IniRepo] = OrderedDict()
+
+        # Successful analysis results by settings repr, least recently used
+        # first, with the states of the repositories they were computed from
+        self._result_cache: OrderedDict[str, tuple[RepoStates, AnalysisResult]]
+        self._result_cache = OrderedDict()
+
         logger.info("Legacy Engine Wrapper initialized")
 
     def execute_analysis(self, settings: Settings) -> AnalysisResult:
@@ -514,11 +658,11 @@ class LegacyEngineWrapper:
             settings: Enhanced GUI settings object
 
         Returns:
-            AnalysisResult compatible with current GUI frontend
+            AnalysisResult compatible with current GUI frontend. Results may be
+            served from the result cache, so callers must not modify them
 
         """
         logger.info("Starting legacy engine analysis")
-        self.performance_monitor.start_monitoring()
 
         with profiler.step("legacy_engine_total"):
             try:
@@ -532,8 +676,11 @@ class LegacyEngineWrapper:
 
                 # Validate repository paths
                 invalid_paths = []
-                for repo_path in settings.input_fstrs:
-                    is_valid, error_msg = validate_file_path(repo_path)
+                for repo_path, (is_valid, error_msg) in zip(
+                    settings.input_fstrs,
+                    self._validate_paths(settings.input_fstrs),
+                    strict=True,
+                ):
                     if not is_valid:
                         invalid_paths.append(f"{repo_path}: {error_msg}")
 
@@ -544,8 +691,44 @@ class LegacyEngineWrapper:
                         error=f"Invalid repository paths: {'; '.join(invalid_paths)}",
                     )
 
-                # Process each repository
-                repo_data_list = []
+                # Reuse the result of an identical analysis of unchanged
+                # repositories. The repositories are only inspected when there is
+                # a cached result for the same settings. Cached results are shared
+                # between callers and must not be modified.
+                settings_key = repr(settings)
+                cached = self._result_cache.get(settings_key)
+                if cached is not None and self._get_repo_states(settings) == cached[0]:
+                    self._result_cache.move_to_end(settings_key)
+                    logger.info("Reusing cached analysis result")
+                    return cached[1]
+
+                # Analyses with since or until are not cached, as git resolves
+                # their dates against the current time. The working tree files are
+                # signed before the analysis, so that a change during the analysis
+                # cannot label an outdated result.
+                worktree_signatures = (
+                    None
+                    if settings.since or settings.until
+                    else [
+                        self._get_worktree_signatures(settings, repo_path)
+                        for repo_path in settings.input_fstrs
+                    ]
+                )
+
+                # Started only after the early returns above, as every path from
+                # here stops it again and with it the memory sampler thread
+                self.performance_monitor.start_monitoring()
+
+                # Translate the settings once, or reuse the translation of
+                # validate_settings; each repository only gets its own input path
+                # and location
+                with profiler.step("settings_translation"):
+                    ini_repo_base = self._translate_settings(settings)
+
+                # Process each repository, converting it to GUI format as soon as it
+                # has been analyzed, so that only one RepoData is held at a time
+                repositories: list[RepositoryResult] = []
+                head_oids: list[OID | None] = []
                 total_commits = 0
                 total_files = 0
                 total_authors = 0
@@ -553,57 +736,20 @@ class LegacyEngineWrapper:
 
                 for repo_path in settings.input_fstrs:
                     try:
-                        with profiler.step(f"repository_{Path(repo_path).name}"):
-                            logger.info(f"Processing repository: {repo_path}")
-
-                            # Translate settings to legacy format for current repository
-                            with profiler.step("settings_translation"):
-                                current_settings = Settings(**settings.__dict__)
-                                current_settings.input_fstrs = [repo_path]
-                                ini_repo = (
-                                    self.settings_translator.translate_to_legacy_args(
-                                        current_settings
-                                    )
-                                )
-
-                            # Create and execute legacy analysis - THIS IS THE CRITICAL STEP
-                            with profiler.step("repo_data_creation"):
-                                logger.info(
-                                    f"Creating RepoData for {repo_path} - this may take time..."
-                                )
-                                repo_data = RepoData(ini_repo)
-                                logger.info(
-                                    f"RepoData creation completed for {repo_path}"
-                                )
-
-                        # Update performance monitoring
-                        self.performance_monitor.update_peak_memory()
-
-                        # Collect statistics
-                        repo_commits = sum(
-                            len(stat.stat.shas)
-                            for stat in repo_data.author2pstat.values()
-                            if stat.person.author != "*"
-                        )
-                        repo_files = len(
-                            [f for f in repo_data.fstr2fstat if f != "*"]
+                        repository, counts, head_oid = self._analyze_repository(
+                            ini_repo_base, repo_path, settings
                         )
-                        repo_authors = len(
-                            [a for a in repo_data.author2pstat if a != "*"]
-                        )
-
+                        repo_commits, repo_files, repo_authors = counts
                         total_commits += repo_commits
                         total_files += repo_files
                         total_authors += repo_authors
-
-                        repo_data_list.append(repo_data)
-
-                        logger.info(
-                            f"Repository processed: {repo_commits} commits, {repo_files} files, {repo_authors} authors"
-                        )
+                        repositories.append(repository)
+                        head_oids.append(head_oid)
 
                     except Exception as e:
-                        logger.exception(f"Failed to process repository {repo_path}: {e}")
+                        logger.exception(
+                            "Failed to process repository %s: %s", repo_path, e
+                        )
                         errors += 1
 
                         # Continue with other repositories on error
@@ -611,7 +757,7 @@ class LegacyEngineWrapper:
 
                 # Stop performance monitoring
                 performance_metrics = self.performance_monitor.stop_monitoring(
-                    repositories_processed=len(repo_data_list),
+                    repositories_processed=len(repositories),
                     total_commits=total_commits,
                     total_files=total_files,
                     total_authors=total_authors,
@@ -621,19 +767,32 @@ class LegacyEngineWrapper:
                 # Log performance summary
                 profiler.log_summary()
 
-                # Convert results to GUI format
-                if repo_data_list:
-                    result = self.result_converter.convert_repo_data_to_analysis_result(
-                        repo_data_list, settings, performance_metrics
+                # Collect the converted repositories
+                if repositories:
+                    result = AnalysisResult(
+                        repositories=repositories, success=True, error=None
                     )
 
                     logger.info(
-                        f"Legacy engine analysis completed successfully: "
-                        f"{len(repo_data_list)} repositories, "
-                        f"{total_commits} commits, "
-                        f"{performance_metrics.duration_seconds:.2f}s"
+                        "Legacy engine analysis completed successfully: "
+                        "%d repositories, %d commits, %.2fs",
+                        len(repositories),
+                        total_commits,
+                        performance_metrics.duration_seconds,
                     )
 
+                    if (
+                        worktree_signatures is not None
+                        and not errors
+                        and None not in head_oids
+                    ):
+                        self._result_cache[settings_key] = (
+                            tuple(zip(head_oids, worktree_signatures, strict=True)),
+                            result,
+                        )
+                        self._result_cache.move_to_end(settings_key)
+                        if len(self._result_cache) > RESULT_CACHE_SIZE:
+                            self._result_cache.popitem(last=False)
                     return result
                 return AnalysisResult(
                     repositories=[],
@@ -642,7 +801,7 @@ class LegacyEngineWrapper:
                 )
 
             except Exception as e:
-                logger.exception(f"Legacy engine analysis failed: {e}")
+                logger.exception("Legacy engine analysis failed: %s", e)
 
                 # Stop monitoring on error
                 with contextlib.suppress(Exception):
@@ -657,6 +816,332 @@ class LegacyEngineWrapper:
                     error=f"Legacy engine analysis failed: {e}",
                 )
 
+    def execute_analysis_stream(self, settings: Settings) -> Iterator[AnalysisResult]:
+        """Execute repository analysis, yielding the result of each repository.
+
+        The settings are validated and translated once for all repositories and
+        the performance monitor covers the whole analysis. Streamed results are
+        not cached.
+
+        Args:
+            settings: Enhanced GUI settings object
+
+        Yields:
+            AnalysisResult holding a single repository, or its error
+
+        """
+        logger.info("Starting streaming legacy engine analysis")
+
+        error_msg = self._check_settings(settings)
+        if error_msg:
+            error_msg = f"Settings validation failed: {error_msg}"
+        else:
+            try:
+                with profiler.step("settings_translation"):
+                    ini_repo_base = self._translate_settings(settings)
+            except Exception as e:
+                error_msg = f"Settings translation failed: {e}"
+        if error_msg:
+            yield AnalysisResult(repositories=[], success=False, error=error_msg)
+            return
+
+        self.performance_monitor.start_monitoring()
+        repositories_processed = 0
+        total_commits = 0
+        total_files = 0
+        total_authors = 0
+        errors = 0
+        try:
+            for repo_path in settings.input_fstrs:
+                try:
+                    repository, counts, _ = self._analyze_repository(
+                        ini_repo_base, repo_path, settings
+                    )
+                except Exception as e:
+                    logger.exception(
+                        "Failed to process repository %s: %s", repo_path, e
+                    )
+                    errors += 1
+                    yield AnalysisResult(
+                        repositories=[],
+                        success=False,
+                        error=f"Failed to process repository {repo_path}: {e}",
+                    )
+                    continue
+
+                repo_commits, repo_files, repo_authors = counts
+                repositories_processed += 1
+                total_commits += repo_commits
+                total_files += repo_files
+                total_authors += repo_authors
+                yield AnalysisResult(
+                    repositories=[repository], success=True, error=None
+                )
+        finally:
+            # Also reached when the consumer stops iterating early
+            self.performance_monitor.stop_monitoring(
+                repositories_processed=repositories_processed,
+                total_commits=total_commits,
+                total_files=total_files,
+                total_authors=total_authors,
+                errors=errors,
+            )
+            profiler.log_summary()
+
+    def _analyze_repository(
+        self, ini_repo_base: IniRepo, repo_path: str, settings: Settings
+    ) -> tuple[RepositoryResult, tuple[int, int, int], OID | None]:
+        """Analyze a single repository and convert it to GUI format.
+
+        Args:
+            ini_repo_base: Settings of the analysis translated to legacy format
+            repo_path: Path of the repository to analyze
+            settings: Enhanced GUI settings object
+
+        Returns:
+            Tuple of (repository result, (commits, files, authors), analyzed HEAD
+            commit)
+
+        """
+        with profiler.step(f"repository_{Path(repo_path).name}"):
+            logger.info("Processing repository: %s", repo_path)
+
+            ini_repo = self._ini_repo_for(ini_repo_base, repo_path)
+
+            # Create and execute legacy analysis - THIS IS THE CRITICAL STEP
+            with profiler.step("repo_data_creation"):
+                logger.info(
+                    "Creating RepoData for %s - this may take time...", repo_path
+                )
+                repo_data = RepoData(ini_repo)
+                logger.info("RepoData creation completed for %s", repo_path)
+
+        # Collect statistics
+        repo_commits, repo_files, repo_authors = self._rollup(repo_data)
+        repository = self.result_converter.convert_one(repo_data, settings)
+
+        logger.info(
+            "Repository processed: %d commits, %d files, %d authors",
+            repo_commits,
+            repo_files,
+            repo_authors,
+        )
+        return (
+            repository,
+            (repo_commits, repo_files, repo_authors),
+            repo_data.head_oid,
+        )
+
+    @staticmethod
+    def _get_repo_states(settings: Settings) -> RepoStates | None:
+        """Get the current states of the repositories of an analysis.
+
+        An analysis gives the same result for the same settings as long as, for
+        each repository, the HEAD commit and the working tree files it reads do
+        not change.
+
+        Args:
+            settings: Settings of the analysis
+
+        Returns:
+            HEAD commit and working tree file signatures per repository, or None
+            if a HEAD commit could not be resolved
+
+        """
+        repo_states: list[tuple[OID, tuple[FileSignature, ...]]] = []
+        for repo_path in settings.input_fstrs:
+            try:
+                with GitRepo(repo_path) as git_repo:
+                    head_oid = git_repo.head.commit.hexsha
+            except (GitError, ValueError):
+                # ValueError: HEAD of a repository without commits
+                return None
+            repo_states.append(
+                (
+                    head_oid,
+                    LegacyEngineWrapper._get_worktree_signatures(settings, repo_path),
+                )
+            )
+        return tuple(repo_states)
+
+    @staticmethod
+    def _get_worktree_signatures(
+        settings: Settings, repo_path: str
+    ) -> tuple[FileSignature, ...]:
+        """Get the signatures of the working tree files an analysis reads.
+
+        These are the RESULT_CACHE_WORKTREE_FILES and the configured ignore-revs
+        file, which is taken relative to the repository unless it is absolute.
+
+        Args:
+            settings: Settings of the analysis
+            repo_path: Path of the repository
+
+        Returns:
+            Signature of each file
+
+        """
+        repo = Path(repo_path)
+        paths = [repo / fstr for fstr in RESULT_CACHE_WORKTREE_FILES]
+        if settings.ignore_revs_file:
+            paths.append(repo / settings.ignore_revs_file)
+        return tuple(LegacyEngineWrapper._get_file_signature(path) for path in paths)
+
+    @staticmethod
+    def _get_file_signature(path: Path) -> FileSignature:
+        """Get the modification time and size of a file.
+
+        Args:
+            path: Path of the file
+
+        Returns:
+            Tuple of (mtime_ns, size), or None if the file does not exist
+
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _ini_repo_for(ini_repo_base: IniRepo, repo_path: str) -> IniRepo:
+        """Get the legacy configuration of a single repository of the analysis.
+
+        The translated args are copied shallowly, only their input path differs
+        between repositories.
+
+        Args:
+            ini_repo_base: Settings of the analysis translated to legacy format
+            repo_path: Path of the repository to analyze
+
+        Returns:
+            IniRepo for the repository
+
+        """
+        args = copy.copy(ini_repo_base.args)
+        args.input_fstrs = [repo_path]
+        path = Path(repo_path)
+        return IniRepo(name=path.name, location=path, args=args)
+
+    def _validate_paths(self, repo_paths: list[str]) -> list[tuple[bool, str]]:
+        """Validate repository paths, reusing recent successful validations.
+
+        The checks are stat calls, which may block on network filesystems, so
+        the paths that are not in the cache are checked from a small thread pool.
+
+        Args:
+            repo_paths: Repository paths to validate
+
+        Returns:
+            List of (is_valid, error_message) tuples, in the order of repo_paths
+
+        """
+        now = time.monotonic()
+        path2result: dict[str, tuple[bool, str]] = {}
+        for repo_path in repo_paths:
+            validated_at = self._valid_paths.get(repo_path)
+            if validated_at is not None and now - validated_at < VALID_PATH_TTL:
+                self._valid_paths.move_to_end(repo_path)
+                path2result[repo_path] = (True, "")
+
+        unchecked = [
+            repo_path
+            for repo_path in dict.fromkeys(repo_paths)
+            if repo_path not in path2result
+        ]
+        if len(unchecked) <= 1:
+            results = [validate_file_path(repo_path) for repo_path in unchecked]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_VALIDATION_WORKERS, len(unchecked))
+            ) as executor:
+                results = list(executor.map(validate_file_path, unchecked))
+
+        for repo_path, result in zip(unchecked, results, strict=True):
+            path2result[repo_path] = result
+            if result[0]:
+                self._valid_paths[repo_path] = now
+                self._valid_paths.move_to_end(repo_path)
+                if len(self._valid_paths) > VALID_PATH_CACHE_SIZE:
+                    self._valid_paths.popitem(last=False)
+        return [path2result[repo_path] for repo_path in repo_paths]
+
+    def _translate_settings(self, settings: Settings) -> IniRepo:
+        """Translate the settings to legacy format, reusing recent translations.
+
+        The returned IniRepo is shared between calls and must not be modified,
+        _ini_repo_for copies its args for each repository.
+
+        Args:
+            settings: Settings of the analysis
+
+        Returns:
+            IniRepo with the translated settings
+
+        """
+        settings_key = repr(settings)
+        ini_repo = self._translations.get(settings_key)
+        if ini_repo is not None:
+            self._translations.move_to_end(settings_key)
+            return ini_repo
+        ini_repo = self.settings_translator.translate_to_legacy_args(settings)
+        self._translations[settings_key] = ini_repo
+        if len(self._translations) > TRANSLATION_CACHE_SIZE:
+            self._translations.popitem(last=False)
+        return ini_repo
+
+    @staticmethod
+    def _rollup(repo_data: RepoData) -> tuple[int, int, int]:
+        """Count commits, files and authors of a repository, skipping "*" totals.
+
+        Args:
+            repo_data: Analyzed repository data
+
+        Returns:
+            Tuple of (commits, files, authors)
+
+        """
+        author2pstat = repo_data.author2pstat
+        fstr2fstat = repo_data.fstr2fstat
+        # Subtract the "*" totals row once instead of testing every key
+        total = author2pstat.get("*")
+        commits = sum(len(pstat.stat.shas) for pstat in author2pstat.values())
+        if total is not None:
+            commits -= len(total.stat.shas)
+        authors = len(author2pstat) - (total is not None)
+        files = len(fstr2fstat) - ("*" in fstr2fstat)
+        return commits, files, authors
+
+    def _check_settings(self, settings: Settings) -> str:
+        """Check the input paths and performance settings of an analysis.
+
+        Args:
+            settings: Settings to check
+
+        Returns:
+            Error message, or an empty string if the settings are valid
+
+        """
+        if not settings.input_fstrs:
+            return "No input repositories specified"
+
+        for repo_path, (is_valid, error_msg) in zip(
+            settings.input_fstrs,
+            self._validate_paths(settings.input_fstrs),
+            strict=True,
+        ):
+            if not is_valid:
+                return f"Invalid repository path {repo_path}: {error_msg}"
+
+        if settings.max_thread_workers < 1:
+            return "max_thread_workers must be at least 1"
+
+        if settings.memory_limit_mb < 64:
+            return "memory_limit_mb must be at least 64 MB"
+
+        return ""
+
     def validate_settings(self, settings: Settings) -> tuple[bool, str]:
         """Validate settings for legacy engine compatibility.
 
@@ -668,26 +1153,13 @@ class LegacyEngineWrapper:
 
         """
         try:
-            # Basic validation
-            if not settings.input_fstrs:
-                return False, "No input repositories specified"
-
-            # Validate repository paths
-            for repo_path in settings.input_fstrs:
-                is_valid, error_msg = validate_file_path(repo_path)
-                if not is_valid:
-                    return False, f"Invalid repository path {repo_path}: {error_msg}"
-
-            # Validate performance settings
-            if settings.max_thread_workers < 1:
-                return False, "max_thread_workers must be at least 1"
-
-            if settings.memory_limit_mb < 64:
-                return False, "memory_limit_mb must be at least 64 MB"
+            error_msg = self._check_settings(settings)
+            if error_msg:
+                return False, error_msg
 
-            # Test settings translation
+            # Test settings translation, which execute_analysis then reuses
             try:
-                self.settings_translator.translate_to_legacy_args(settings)
+                self._translate_settings(settings)
             except Exception as e:
                 return False, f"Settings translation failed: {e}"
 
@@ -700,38 +1172,13 @@ class LegacyEngineWrapper:
         """Get information about the legacy engine capabilities.
 
         Returns:
-            Dictionary with engine information and capabilities
+            Copy of ENGINE_INFO with lists instead of tuples, which callers may
+            change without affecting later calls
 
         """
         return {
-            "engine_name": "GitInspectorGUI Legacy Analysis Engine",
-            "version": "4.0.0",
-            "capabilities": [
-                "Advanced person identity merging",
-                "Sophisticated statistics calculation",
-                "Comprehensive blame analysis",
-                "Performance-optimized git operations",
-                "Pattern-based filtering",
-                "Memory management",
-                "Multi-threading support",
-                "Cross-platform compatibility",
-            ],
-            "supported_formats": ["html", "excel"],
-            "supported_repositories": ["git"],
-            "performance_features": [
-                "Configurable threading",
-                "Memory limits",
-                "Chunked processing",
-                "Garbage collection optimization",
-            ],
-            "filtering_features": [
-                "Author patterns (glob/regex)",
-                "Email patterns (glob/regex)",
-                "Message patterns (glob/regex)",
-                "File patterns (glob/regex)",
-                "Ignore-revs file support",
-                "Date range filtering",
-            ],
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in ENGINE_INFO.items()
         }
 
 
@@ -27,7 +27,14 @@ from typing import TypeVar
 
 from gigui.analysis.blame.engine import RepoBlameHistory
 from gigui.core.person_manager import PersonsDB
-from gigui.core.statistics import CommitGroup, FileStat, IniRepo, Person, PersonStat
+from gigui.core.statistics import (
+    CommitGroup,
+    FileStat,
+    IniRepo,
+    Person,
+    PersonStat,
+    Stat,
+)
 from gigui.typedefs import SHA, Author, FileStr, PercentageValue
 
 logger = getLogger(__name__)
@@ -393,24 +400,36 @@ class StatTables:
         """
         # Initialize with wildcard entries for totals
         target = {"*": {"*": FileStat("*")}}
+        author2fstr2groups: dict[Author, dict[FileStr, list[CommitGroup]]] = {}
         for author in persons_db.authors_included:
             target[author] = {"*": FileStat("*")}
+            author2fstr2groups[author] = {}
 
-        # Process commits from newest to oldest for accurate statistics
+        # Bucket commit groups per author and file, from newest to oldest, so
+        # that each statistic is reduced once from all of its groups
+        all_groups: list[CommitGroup] = []
         for fstr in fstrs:
-            for commit_group in fstr2commit_groups[fstr]:
-                # Update global totals
-                target["*"]["*"].stat.add_commit_group(commit_group)
-
+            commit_groups = fstr2commit_groups[fstr]
+            all_groups.extend(commit_groups)
+            for commit_group in commit_groups:
                 # Resolve author through person database
                 author = persons_db[commit_group.author].author
-                target[author]["*"].stat.add_commit_group(commit_group)
-
-                # Create file-specific entry if needed
-                if fstr not in target[author]:
-                    target[author][fstr] = FileStat(fstr)
-                target[author][fstr].add_commit_group(commit_group)
+                author2fstr2groups[author].setdefault(fstr, []).append(commit_group)
 
+        for author, fstr2groups in author2fstr2groups.items():
+            fstr2fstat = target[author]
+            fstr2fstat["*"].stat = Stat.from_groups(
+                group for groups in fstr2groups.values() for group in groups
+            )
+            for fstr, groups in fstr2groups.items():
+                fstat = FileStat(fstr)
+                for commit_group in groups:
+                    fstat.add_name(commit_group.fstr)
+                fstat.stat = Stat.from_groups(groups)
+                fstr2fstat[fstr] = fstat
+
+        # Global totals, set last because "*" is also an included author
+        target["*"]["*"].stat = Stat.from_groups(all_groups)
         return target
 
     @staticmethod
@@ -434,19 +453,24 @@ class StatTables:
         """
         source = author2fstr2fstat
         target: dict[FileStr, FileStat] = {}
-        fstrs = set()
+        fstr2stats: dict[FileStr, list[Stat]] = {}
 
-        # Aggregate statistics from all authors for each file
+        # Collect the statistics of all authors for each file
         for author, fstr2fstat in source.items():
             if author == "*":
                 target["*"] = source["*"]["*"]
             else:
                 for fstr, fstat in fstr2fstat.items():
                     if fstr != "*":
-                        fstrs.add(fstr)
                         if fstr not in target:
                             target[fstr] = FileStat(fstr)
-                        target[fstr].stat.add(fstat.stat)
+                            fstr2stats[fstr] = []
+                        fstr2stats[fstr].append(fstat.stat)
+
+        # Aggregate them once per file
+        for fstr, stats in fstr2stats.items():
+            target[fstr].stat = Stat.from_stats(stats)
+        fstrs = fstr2stats.keys()
 
         # Add file name history for rename tracking
         for fstr in fstrs:
@@ -474,6 +498,7 @@ class StatTables:
         """
         source = author2fstr2fstat
         target: dict[FileStr, dict[Author, FileStat]] = {}
+        fstr2stats: dict[FileStr, list[Stat]] = {}
 
         for author, fstr2fstat in source.items():
             if author == "*":
@@ -487,12 +512,17 @@ class StatTables:
                 # Initialize file entry with wildcard totals
                 if fstr not in target:
                     target[fstr] = {"*": FileStat(fstr)}
+                    fstr2stats[fstr] = []
 
                 # Add author-specific statistics
                 target[fstr][author] = fstat
-                target[fstr]["*"].stat.add(fstat.stat)
+                fstr2stats[fstr].append(fstat.stat)
                 target[fstr]["*"].names = fstat.names
 
+        # Aggregate the wildcard totals once per file
+        for fstr, stats in fstr2stats.items():
+            target[fstr]["*"].stat = Stat.from_stats(stats)
+
         return target
 
     @staticmethod
@@ -525,10 +555,9 @@ class StatTables:
 
             # Create person statistics for real authors
             target[author] = PersonStat(persons_db[author])
-            for fstr, fstat in fstr2fstat.items():
-                if fstr == "*":
-                    continue
-                target[author].stat.add(fstat.stat)
+            target[author].stat = Stat.from_stats(
+                fstat.stat for fstr, fstat in fstr2fstat.items() if fstr != "*"
+            )
 
         return target
 
@@ -7,8 +7,12 @@ algorithms for accurate git analysis.
 Migrated from gitinspectorgui-old/src/gigui/person_data.py
 """
 
+import re
+import sys
 import time
-from fnmatch import fnmatchcase
+from collections.abc import Iterable
+from fnmatch import translate
+from functools import lru_cache
 from logging import getLogger
 
 from gigui.typedefs import Author, Email
@@ -22,6 +26,72 @@ logger = getLogger(__name__)
 NOW = int(time.time())  # current time as Unix timestamp in seconds since epoch
 
 
+@lru_cache(maxsize=32)
+def compile_filter_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile fnmatch patterns into one case-insensitive regex.
+
+    Matching a lowercased string against the result is equivalent to matching it
+    with fnmatchcase against each of the lowercased patterns.
+
+    Args:
+        patterns: Tuple of fnmatch patterns
+
+    Returns:
+        Compiled regex matching any of the patterns, or None if there are no
+        patterns
+
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(f"(?:{translate(pattern.lower())})" for pattern in patterns)
+    )
+
+
+@lru_cache(maxsize=10000)
+def filter_hit(author_or_email: str, patterns: tuple[str, ...]) -> bool:
+    """Check if an author or email matches any of the fnmatch patterns, ignoring case.
+
+    The same authors and emails are checked for every commit, so results are
+    cached per string and pattern tuple.
+
+    Args:
+        author_or_email: Author name or email address
+        patterns: Tuple of fnmatch patterns
+
+    Returns:
+        True if any pattern matches
+
+    """
+    regex = compile_filter_patterns(patterns)
+    return regex is not None and regex.match(author_or_email.lower()) is not None
+
+
+def author_rank(author: Author) -> tuple[int, int]:
+    """Get the sort key of an author name, lower is preferred.
+
+    Implements sophisticated author name normalization:
+    1. Top authors: Names with spaces and only alphanumeric/space characters
+    2. Nice authors: Names with spaces but may have special characters
+    3. Other authors: Single names or names with special characters
+    Within each class, shorter names are preferred.
+
+    Args:
+        author: Author name
+
+    Returns:
+        Tuple of (class index, name length)
+
+    """
+    # nice authors have first and last name
+    if " " in author:
+        # top authors also do not have a period or comma in their name.
+        if "".join(author.split()).isalnum():
+            return 0, len(author)
+        return 1, len(author)
+    return 2, len(author)
+
+
 class Person:
     """Represents a person with multiple author names and email addresses.
 
@@ -37,15 +107,24 @@ class Person:
     - Identity merging algorithms
     """
 
-    show_renames: bool
+    show_renames: bool = False
     ex_author_patterns: list[str] = []
     ex_email_patterns: list[str] = []
 
     def __init__(self, author: Author, email: Email) -> None:
         super().__init__()
+        author = sys.intern(author)
+        email = sys.intern(email)
         self.authors: set[Author] = {author}
         self.emails: set[Email] = {email}
-        self.author: Author = self.get_author()
+        # Preferred author name, updated when authors are added
+        self._author: Author = author
+        # Values derived from authors and emails, cleared by _reset_caches
+        self._name_parts: list[str] | None = None
+        self._hash: int | None = None
+        # Formatted authors and emails strings, keyed by show_renames
+        self._authors_strs: dict[bool, str] = {}
+        self._emails_strs: dict[bool, str] = {}
 
         # If any of the filters match, this will be set to True
         # so that the person will be excluded from the output.
@@ -66,15 +145,15 @@ class Person:
         """Check if author or email matches any filter patterns.
 
         Uses case-insensitive fnmatch pattern matching to determine
-        if the given author or email should be excluded.
+        if the given author or email should be excluded. Results are cached,
+        see filter_hit.
         """
+        if not patterns:  # No exclusion patterns, the common case
+            return
         if (
             not self.filter_matched
             and author_or_email != "*"
-            and any(
-                fnmatchcase(author_or_email.lower(), pattern.lower())
-                for pattern in patterns
-            )
+            and filter_hit(author_or_email, tuple(patterns))
         ):
             self.filter_matched = True
 
@@ -91,15 +170,60 @@ class Person:
             Self (for method chaining)
 
         """
-        self.authors |= other.authors
+        n_authors = len(self.authors)
+        self.authors.update(other.authors)
+        if author_rank(other.author) < author_rank(self._author):
+            self._author = other.author
         if self.emails == {""}:
-            self.emails = other.emails
+            # Copy, so that later changes to other do not affect this person
+            self.emails = set(other.emails)
         else:
-            self.emails |= other.emails
+            self.emails.update(other.emails)
         self.filter_matched = self.filter_matched or other.filter_matched
-        self.author = self.get_author()
+        self._reset_caches(authors_changed=len(self.authors) != n_authors)
         return self
 
+    def add_author(self, author: Author) -> None:
+        """Add an author name to this person and apply the author filters.
+
+        Args:
+            author: Author name to add
+
+        """
+        if author not in self.authors:
+            self.authors.add(author)
+            if author_rank(author) < author_rank(self._author):
+                self._author = author
+            self._reset_caches(authors_changed=True)
+        self.match_author_filter(author)
+
+    def add_email(self, email: Email) -> None:
+        """Add an email address to this person and apply the email filters.
+
+        Args:
+            email: Email address to add
+
+        """
+        if self.emails == {""}:
+            self.emails = {email}
+        else:
+            self.emails.add(email)
+        self._reset_caches(authors_changed=False)
+        self.match_email_filter(email)
+
+    def _reset_caches(self, *, authors_changed: bool) -> None:
+        """Clear cached values that depend on the changed authors or emails."""
+        if authors_changed:
+            self._name_parts = None
+            self._authors_strs.clear()
+        self._emails_strs.clear()
+        self._hash = None
+
+    @property
+    def author(self) -> Author:
+        """Get the preferred author name."""
+        return self._author
+
     def __repr__(self) -> str:
         authors = self.authors_str
         emails = self.emails_str
@@ -112,55 +236,43 @@ class Person:
     def __str__(self) -> str:
         return f"{self.authors_str}, {self.emails_str}\n"
 
-    # Required for manipulating Person objects in a set
+    # Required for manipulating Person objects in a set. Persons are only put in
+    # sets after merging, so the hash is cached until authors or emails change.
     def __hash__(self) -> int:
-        return hash((frozenset(self.authors), frozenset(self.emails)))
+        if self._hash is None:
+            self._hash = hash((frozenset(self.authors), frozenset(self.emails)))
+        return self._hash
 
     def get_authors(self) -> list[Author]:
-        """Get authors sorted by quality preference.
-
-        Implements sophisticated author name normalization:
-        1. Top authors: Names with spaces and only alphanumeric/space characters
-        2. Nice authors: Names with spaces but may have special characters
-        3. Other authors: Single names or names with special characters
+        """Get authors sorted by quality preference, see author_rank.
 
         Returns:
             List of authors sorted by preference and length
 
         """
-        # nice authors have first and last name
-        nice_authors = {author for author in self.authors if " " in author}
-
-        # top authors also do not have a period or comma in their name.
-        top_authors = {
-            author
-            for author in nice_authors
-            if all(c.isalnum() or c.isspace() for c in author)
-        }
-
-        nice_authors = nice_authors - top_authors
-        other_authors = self.authors - top_authors - nice_authors
-        return (
-            sorted(top_authors, key=len)
-            + sorted(nice_authors, key=len)
-            + sorted(other_authors, key=len)
-        )
+        return sorted(self.authors, key=author_rank)
 
     def get_author(self) -> Author:
-        """Get the best/preferred author name for this person."""
-        return self.get_authors()[0]
+        """Get the best/preferred author name for this person.
+
+        The preferred author is kept up to date when authors are added, so this
+        does not sort the authors.
+        """
+        return self._author
 
     @property
     def authors_str(self) -> str:
         """Get formatted string representation of authors.
 
         Returns either all authors (if show_renames is True) or just
-        the preferred author name.
+        the preferred author name. The result is cached until authors change.
         """
-        if self.show_renames:
-            authors = self.get_authors()
-            return " | ".join(authors)
-        return self.author
+        authors_str = self._authors_strs.get(self.show_renames)
+        if authors_str is None:
+            authors_str = self._authors_strs[self.show_renames] = (
+                " | ".join(self.get_authors()) if self.show_renames else self.author
+            )
+        return authors_str
 
     @property
     def emails_str(self) -> str:
@@ -171,10 +283,19 @@ class Person:
         - If show_renames is True, return all emails
         - Otherwise, prefer emails that contain parts of the author name
 
+        The result is cached until authors or emails change.
+
         Returns:
             Formatted email string
 
         """
+        emails_str = self._emails_strs.get(self.show_renames)
+        if emails_str is None:
+            emails_str = self._emails_strs[self.show_renames] = self._get_emails_str()
+        return emails_str
+
+    def _get_emails_str(self) -> str:
+        """Get formatted string representation of emails, see emails_str."""
         emails = list(self.emails)
         emails = sorted(emails, key=len)
         if len(emails) == 1:
@@ -182,18 +303,25 @@ class Person:
         if self.show_renames:
             return " | ".join(emails)
         email_list = list(self.emails)
-        name_parts = self.author.split()
-        name_parts = [part.lower() for part in name_parts if len(part) >= 3]
+        name_parts = self.name_parts
         # If any part with size >= 3 of author name is in the email, use that email
-        nice_emails = [
-            email for email in email_list if any(part in email for part in name_parts)
-        ]
-        if nice_emails:
-            return nice_emails[0]
+        for email in email_list:
+            email_lower = email.lower()
+            if any(part in email_lower for part in name_parts):
+                return email
         return email_list[0]  # assume self.emails cannot be empty
 
+    @property
+    def name_parts(self) -> list[str]:
+        """Get the lowercased parts with size >= 3 of the preferred author name."""
+        if self._name_parts is None:
+            self._name_parts = [
+                part.lower() for part in self.author.split() if len(part) >= 3
+            ]
+        return self._name_parts
+
 
-class PersonsDB(dict[Author | Email, Person]):
+class PersonsDB:
     """Database for managing collections of persons with identity merging.
 
     This class provides sophisticated person identity management that can
@@ -211,21 +339,45 @@ class PersonsDB(dict[Author | Email, Person]):
     - Handling of empty/None authors and emails
     - Filter support for excluding persons
     - Efficient person lookup and management
+
+    Persons are looked up by author or email in a plain dict. A second dict
+    holds each unique person by id together with its keys, so that listing
+    persons and remapping keys after a merge do not scan all keys.
     """
 
     def __init__(self) -> None:
-        super().__init__()
-        self["*"] = Person("*", "*")
+        self._by_key: dict[Author | Email, Person] = {}
+        self._by_id: dict[int, tuple[Person, list[Author | Email]]] = {}
+        self._set("*", Person("*", "*"))
         # There can only be one empty "" key. If the "" key is present, it
         # belongs to a person where both author and email are the empty string ""
 
-    def __getitem__(self, key: Author | Email | None) -> Person:
-        key = "" if key is None else key
-        return super().__getitem__(key)
+    def __getitem__(self, key: Author | Email) -> Person:
+        """Get the person for an author or email.
 
-    def __setitem__(self, key: Author | Email | None, value: Person) -> None:
-        key = "" if key is None else key
-        super().__setitem__(key, value)
+        Keys must be strings, an unknown author or email is the empty string "".
+        Only add_person and get_filtered_author also accept None.
+        """
+        return self._by_key[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._by_key
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def get(self, key: Author | Email) -> Person | None:
+        """Get the person for an author or email, or None if not present."""
+        return self._by_key.get(key)
+
+    def _set(self, key: Author | Email, person: Person) -> None:
+        """Let a new key refer to a person."""
+        self._by_key[key] = person
+        entry = self._by_id.get(id(person))
+        if entry is None:
+            self._by_id[id(person)] = (person, [key])
+        else:
+            entry[1].append(key)
 
     def add_person(self, author: Author | None, email: Email | None) -> "Person":
         """Add a person to the database with sophisticated identity merging.
@@ -243,8 +395,9 @@ class PersonsDB(dict[Author | Email, Person]):
             Person object (either existing or newly created)
 
         """
-        author = "" if author is None else author
-        email = "" if email is None else email
+        # Interned, as the same authors and emails are added for every commit
+        author = "" if author is None else sys.intern(author)
+        email = "" if email is None else sys.intern(email)
 
         if author == "":
             if email != "":
@@ -252,38 +405,79 @@ class PersonsDB(dict[Author | Email, Person]):
                     f"Author is empty but email is not. Author: {author}, Email: {email}"
                     "Git should not allow this. Using empty for both."
                 )
-            if "" in self:
-                return self[""]
+            if "" in self._by_key:
+                return self._by_key[""]
             person = Person("", "")
-            self[""] = person
+            self._set("", person)
             return person
         if email == "":
             return self.add_author_with_unknown_email(author)
         # Both author and email are known
-        p_author = self.get(author)
-        p_email = self.get(email)
+        p_author = self._by_key.get(author)
+        p_email = self._by_key.get(email)
 
         if p_author is not None:
             if p_email is not None:
                 if p_author == p_email:
                     return p_author  # existing person
-                return p_author.merge(p_email)  # merge persons
+                return self._merge_persons(p_author, p_email)
             # author exists, email is new
-            p_author.merge(Person(author, email))
-            self[email] = p_author
+            p_author.add_email(email)
+            self._set(email, p_author)
             return p_author
         if p_email is not None:
-            p_email.merge(Person(author, email))
-            self[author] = p_email
+            # email exists, author is new
+            p_email.add_author(author)
+            self._set(author, p_email)
             return p_email
-        # new person
+        # new person, stored directly as neither key is present yet
         person = Person(author, email)
-        self[author] = person
-        self[email] = person
+        self._by_key[author] = self._by_key[email] = person
+        self._by_id[id(person)] = (person, [author, email])
         return person
 
+    def add_persons_bulk(
+        self, author_emails: Iterable[tuple[Author | None, Email | None]]
+    ) -> None:
+        """Add many author/email pairs, each distinct pair only once.
+
+        Args:
+            author_emails: Author name and email address pairs, e.g. one per commit
+
+        """
+        for author, email in dict.fromkeys(author_emails):
+            self.add_person(author, email)
+
+    def _merge_persons(self, person1: Person, person2: Person) -> Person:
+        """Merge two different persons and let all their keys refer to the result.
+
+        The person with fewer authors and emails is merged into the other one.
+
+        Args:
+            person1: Person found for the author
+            person2: Person found for the email
+
+        Returns:
+            Merged person
+
+        """
+        if len(person1.authors) + len(person1.emails) >= len(person2.authors) + len(
+            person2.emails
+        ):
+            big, small = person1, person2
+        else:
+            big, small = person2, person1
+        big.merge(small)
+        _, small_keys = self._by_id.pop(id(small))
+        for key in small_keys:
+            self._by_key[key] = big
+        self._by_id[id(big)][1].extend(small_keys)
+        return big
+
     def __repr__(self) -> str:
-        return "\n".join(f"{key}:\n{person!r}" for key, person in self.items())
+        return "\n".join(
+            f"{key}:\n{person!r}" for key, person in self._by_key.items()
+        )
 
     def __str__(self) -> str:
         return "\n".join(str(person) for person in self.persons)
@@ -291,9 +485,9 @@ class PersonsDB(dict[Author | Email, Person]):
     @property
     def persons(self) -> list["Person"]:
         """Get all unique persons sorted by author name."""
-        persons = self.values()
-        persons_set = set(persons)
-        return sorted(persons_set, key=lambda x: x.author)
+        return sorted(
+            (person for person, _ in self._by_id.values()), key=lambda x: x.author
+        )
 
     @property
     def authors(self) -> list[Author]:
@@ -303,10 +497,7 @@ class PersonsDB(dict[Author | Email, Person]):
     @property
     def filtered_persons(self) -> list["Person"]:
         """Get persons that are not filtered out."""
-        persons_set_filtered = {
-            person for person in self.persons if not person.filter_matched
-        }
-        return sorted(persons_set_filtered, key=lambda x: x.author)
+        return [person for person in self.persons if not person.filter_matched]
 
     @property
     def authors_included(self) -> list[Author]:
@@ -328,10 +519,11 @@ class PersonsDB(dict[Author | Email, Person]):
             Person object (either existing or newly created)
 
         """
-        if author in self:
-            return self[author]
+        person = self._by_key.get(author)
+        if person is not None:
+            return person
         person = Person(author, "")
-        self[author] = person
+        self._set(author, person)
         return person
 
     def get_filtered_author(self, author: Author | None) -> Author | None:
@@ -344,7 +536,7 @@ class PersonsDB(dict[Author | Email, Person]):
             Author name if not filtered, None otherwise
 
         """
-        person = self[author]
+        person = self._by_key["" if author is None else author]
         if person.filter_matched:
             return None
         return person.author
@@ -18,25 +18,32 @@ Key Features:
 - File rename tracking and history management
 """
 
-import copy
-import re
+import codecs
+import sys
+import threading
+from bisect import bisect_right
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
 from fnmatch import fnmatchcase
 from logging import getLogger
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
+from git import Blob
 from git import Commit as GitCommit
 from git import Repo as GitRepo
+from git.repo.fun import find_submodule_git_dir, is_git_dir
 
-from gigui.core.person_manager import PersonsDB
+from gigui.core.person_manager import PersonsDB, compile_filter_patterns
 from gigui.core.statistics import CommitGroup, FileStat, IniRepo
 from gigui.typedefs import (
     OID,
     SHA,
+    Author,
     CommitGroupsDict,
+    Email,
     FileStr,
     LineCountDict,
     Rev,
@@ -48,8 +55,14 @@ logger = getLogger(__name__)
 
 # Constants for git operations
 GIT_LOG_CHUNK_SIZE = 100  # Chunk size for git log operations
+GIT_LOG_READ_SIZE = 64 * 1024  # Bytes read at a time from streamed git log output
+BLOB_READ_SIZE = 1024 * 1024  # Bytes read at a time from a blob for line counting
 MAX_THREAD_WORKERS = 6  # Maximum number of thread workers
+LOG_DOT_FLUSH_INTERVAL = 64  # Progress dots written between flushes of stdout
 BLAME_CHUNK_SIZE = 20  # Chunk size for blame operations
+# Rename map key of a file name from before the since date, which has commit
+# number 0 like all SHAs outside the analyzed range
+PRE_RANGE_SHA: SHA = ""
 
 # Time constants
 SECONDS_IN_DAY = 60 * 60 * 24
@@ -75,7 +88,7 @@ DEFAULT_EXTENSIONS = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class SHADateNr:
     """SHA with date and number for commit ordering.
 
@@ -217,8 +230,13 @@ class RepoBase:
         self.persons_db: PersonsDB = PersonsDB()
         self.git_repo: GitRepo | None = None
 
+        # Git repo instances of worker threads, GitPython is not thread-safe
+        self._thread_local = threading.local()
+        self._thread_git_repos: list[GitRepo] = []
+
         # File management
         self._fstrs: list[FileStr] = []
+        self._fstrs_sorted: list[FileStr] | None = None
         self.fstr2fstat: dict[FileStr, FileStat] = {}
         self.fstr2line_count: LineCountDict = {}
         self.fstr2commit_groups: CommitGroupsDict = {}
@@ -226,11 +244,14 @@ class RepoBase:
         # Exclusions
         self.ex_revisions: set[Rev] = set(self.args.ex_revisions)
         self.ex_shas: set[SHA] = set()
+        self._ex_files_re = compile_filter_patterns(tuple(self.args.ex_files))
+        self._ex_messages_re = compile_filter_patterns(tuple(self.args.ex_messages))
 
         # Commit data
         self.sha_since_until_date_nrs: list[SHADateNr] = []
         self.sha_since_until_nrs: list[int] = []
         self.sha2author: SHAToAuthorDict = {}
+        self._author_filter_cache: dict[Author, bool] = {}  # filter_matched per author
 
         # SHA mappings (set in init_git_repo)
         self.sha2oid: dict[SHA, OID] = {}
@@ -242,33 +263,54 @@ class RepoBase:
         self.fr2sha2f: dict[FileStr, dict[SHA, FileStr]] = {}
         self.fr2sha_nr2f: dict[FileStr, dict[int, FileStr]] = {}
         self.fr2sha_nrs: dict[FileStr, list[int]] = {}
+        self._fr2sha_nrs_asc: dict[FileStr, list[int]] = {}  # for bisect lookups
+        # Newest sha nr and file name per root file, for lookups at HEAD
+        self._fr2newest: dict[FileStr, tuple[int, FileStr]] = {}
+        self._all_sha2f: dict[FileStr, dict[SHA, FileStr]] | None = None
+        self._renamed_fstrs: set[FileStr] | None = None
 
         # Head commit information (set in init_git_repo)
         self.head_commit: GitCommit | None = None
         self.head_oid: OID | None = None
         self.head_sha: SHA | None = None
+        self._head_blobs: list[Blob] | None = None
+        self._dot_count: int = 0  # Progress dots written since the last flush
 
     @property
     def fstrs(self) -> list[FileStr]:
         """Get filtered and sorted list of file strings.
 
         Returns the private _fstrs list before analysis, or a sorted list
-        based on blame line count after analysis and blame run.
+        based on blame line count after analysis and blame run. The sorted list
+        is computed once per assignment of fstr2fstat.
 
         Returns:
             List of file strings, sorted by relevance
 
         """
-        if not self.fstr2fstat:  # analysis and blame run not yet executed
+        if not self._fstr2fstat:  # analysis and blame run not yet executed
             return list(self._fstrs)
-        # after analysis and blame run
-        # fstr2fstat.keys() can be a subset of self._fstrs due to exclusions
-        fstrs = [fstr for fstr in self.fstr2fstat if fstr != "*"]
-        return sorted(
-            fstrs,
-            key=lambda x: self.fstr2fstat[x].stat.blame_line_count,
-            reverse=True,
-        )
+        if self._fstrs_sorted is None:
+            # after analysis and blame run
+            # fstr2fstat.keys() can be a subset of self._fstrs due to exclusions
+            fstrs = [fstr for fstr in self._fstr2fstat if fstr != "*"]
+            self._fstrs_sorted = sorted(
+                fstrs,
+                key=lambda x: self._fstr2fstat[x].stat.blame_line_count,
+                reverse=True,
+            )
+        return self._fstrs_sorted
+
+    @property
+    def fstr2fstat(self) -> dict[FileStr, FileStat]:
+        """Get the mapping of files to their statistics."""
+        return self._fstr2fstat
+
+    @fstr2fstat.setter
+    def fstr2fstat(self, fstr2fstat: dict[FileStr, FileStat]) -> None:
+        """Set the mapping of files to their statistics, resetting sorted fstrs."""
+        self._fstr2fstat = fstr2fstat
+        self._fstrs_sorted = None
 
     @property
     def star_fstrs(self) -> list[FileStr]:
@@ -310,21 +352,17 @@ class RepoBase:
 
         # Use git log to get both long and short SHAs
         log_output = self.git_repo.git.log("--pretty=format:%H %h")
-        lines = log_output.splitlines()
+        pairs = [line.split(" ", 1) for line in log_output.splitlines() if line]
+        if not pairs:
+            return
+        oids, shas = zip(*pairs, strict=True)
 
         # Set commit numbers (first line = highest number, initial commit = 1)
-        nr = len(lines)
-        for line in lines:
-            if not line.strip():
-                continue
-            parts = line.split()
-            if len(parts) >= 2:
-                oid, sha = parts[0], parts[1]
-                self.sha2oid[sha] = oid
-                self.oid2sha[oid] = sha
-                self.sha2nr[sha] = nr
-                self.nr2sha[nr] = sha
-                nr -= 1
+        nrs = range(len(shas), 0, -1)
+        self.sha2oid = dict(zip(shas, oids, strict=True))
+        self.oid2sha = dict(zip(oids, shas, strict=True))
+        self.sha2nr = dict(zip(shas, nrs, strict=True))
+        self.nr2sha = dict(zip(nrs, shas, strict=True))
 
     def _set_head_commit(self) -> None:
         """Set head commit based on until parameter."""
@@ -332,11 +370,14 @@ class RepoBase:
             msg = "Git repository not initialized"
             raise RuntimeError(msg)
 
-        # Set head_commit to the top-level commit at the date given by args.until
+        # Set head_commit to the top-level commit at the date given by args.until.
+        # Only that commit is requested, the commit object reads its data lazily.
         if self.args.until:
-            commits = list(self.git_repo.iter_commits(until=self.args.until))
-            if commits:
-                self.head_commit = commits[0]
+            oid: OID = self.git_repo.git.rev_list(
+                "-n", "1", f"--until={self.args.until}", "HEAD"
+            ).strip()
+            if oid:
+                self.head_commit = self.git_repo.commit(oid)
             else:
                 self.head_commit = self.git_repo.head.commit
         else:
@@ -344,6 +385,7 @@ class RepoBase:
 
         self.head_oid = self.head_commit.hexsha
         self.head_sha = self.oid2sha[self.head_oid]
+        self._head_blobs = None
 
     def run_base(self) -> None:
         """Execute base repository analysis operations.
@@ -419,21 +461,15 @@ class RepoBase:
             Path(self.args.subfolder) / fstr for fstr in self.args.include_files
         ]
         include_files: list[FileStr] = [str(path) for path in include_file_paths]
+        include_re = compile_filter_patterns(tuple(include_files))
 
-        if not self.head_commit:
+        if include_re is None:
             return []
 
         matches = [
-            blob.path  # type: ignore
-            for blob in self.head_commit.tree.traverse()
-            if (
-                blob.type == "blob"  # type: ignore
-                and any(
-                    fnmatchcase(blob.path.lower(), pattern.lower())  # type: ignore
-                    for pattern in include_files
-                )
-                and blob.path in files_set  # type: ignore
-            )
+            blob.path
+            for blob in self._get_head_blobs()
+            if include_re.match(blob.path.lower()) and blob.path in files_set
         ]
         files = sorted(matches, key=lambda match: file2nr.get(match, 0))
 
@@ -441,6 +477,28 @@ class RepoBase:
             return files
         return files[: self.args.n_files]
 
+    def _get_head_blobs(self) -> list[Blob]:
+        """Get all blobs in the tree of the head commit.
+
+        The tree is traversed once and the blobs are cached for all later calls.
+        Blob sizes are still read lazily, only for the blobs that need them.
+
+        Returns:
+            List of blobs in the head commit tree
+
+        """
+        if self._head_blobs is None:
+            self._head_blobs = (
+                [
+                    blob
+                    for blob in self.head_commit.tree.traverse()
+                    if blob.type == "blob"  # type: ignore
+                ]
+                if self.head_commit
+                else []
+            )
+        return self._head_blobs  # type: ignore
+
     def _get_sorted_worktree_files(self) -> list[FileStr]:
         """Get files in worktree, reverse sorted by file size.
 
@@ -459,19 +517,18 @@ class RepoBase:
 
             def _get_subfolder_blobs() -> list:
                 """Get blobs that are in the specified subfolder."""
-                if not self.head_commit:
-                    return []
-
+                subfolder = self.args.subfolder.lower()
+                if not any(char in subfolder for char in "*?["):
+                    # Plain directory prefix, no glob matching needed
+                    return [
+                        blob
+                        for blob in self._get_head_blobs()
+                        if blob.path.lower().startswith(subfolder)
+                    ]
                 return [
                     blob
-                    for blob in self.head_commit.tree.traverse()
-                    if (
-                        (blob.type == "blob")  # type: ignore
-                        and fnmatchcase(
-                            blob.path.lower(),  # type: ignore
-                            f"{self.args.subfolder}*".lower(),
-                        )
-                    )
+                    for blob in self._get_head_blobs()
+                    if fnmatchcase(blob.path.lower(), f"{subfolder}*")
                 ]
 
             blobs: list = _get_subfolder_blobs()
@@ -479,14 +536,15 @@ class RepoBase:
                 logger.warning(f"No files found in subfolder {self.args.subfolder}")
                 return []
 
+            extensions = set(self.args.extensions)
             return [
                 (blob.path, blob.size)  # type: ignore
                 for blob in blobs
                 if (
                     # Include files with correct extensions and not excluded
                     (
-                        "*" in self.args.extensions
-                        or (blob.path.split(".")[-1] in self.args.extensions)
+                        "*" in extensions
+                        or (blob.path.rpartition(".")[2] in extensions)
                     )
                     and not self._matches_ex_file(blob.path)
                 )
@@ -507,32 +565,76 @@ class RepoBase:
             True if file should be excluded
 
         """
-        return any(
-            fnmatchcase(fstr.lower(), pattern.lower()) for pattern in self.args.ex_files
+        return (
+            self._ex_files_re is not None
+            and self._ex_files_re.match(fstr.lower()) is not None
         )
 
     def _set_fdata_line_count(self) -> None:
-        """Set line counts for all files in the analysis."""
+        """Set line counts for all files in the analysis.
+
+        The blob contents are read by object id through the persistent
+        ``git cat-file --batch`` process of the git command wrapper, so that all
+        files are read over a single pipe. Lines are counted as
+        ``len(text.split("\n"))``, so a trailing newline adds an empty last line
+        and an empty file has one line. Files that are not valid UTF-8 count 0.
+        """
         self.fstr2line_count["*"] = 0
 
-        if not self.head_commit:
+        if not self.head_commit or not self.git_repo:
             return
 
-        for blob in self.head_commit.tree.traverse():
-            if (
-                blob.type == "blob"  # type: ignore
-                and blob.path in self.fstrs  # type: ignore
-                and blob.path not in self.fstr2line_count  # type: ignore
-            ):
-                try:
-                    # Count lines in blob
-                    content = blob.data_stream.read().decode("utf-8")  # type: ignore
-                    line_count: int = len(content.split("\n"))
-                    self.fstr2line_count[blob.path] = line_count  # type: ignore
-                    self.fstr2line_count["*"] += line_count
-                except (UnicodeDecodeError, Exception) as e:
-                    logger.warning(f"Could not read file {blob.path}: {e}")  # type: ignore
-                    self.fstr2line_count[blob.path] = 0  # type: ignore
+        fstrs: set[FileStr] = set(self.fstrs)
+        fstr2oid: dict[FileStr, OID] = {}
+        for blob in self._get_head_blobs():
+            if blob.path in fstrs and blob.path not in fstr2oid:
+                fstr2oid[blob.path] = blob.hexsha
+
+        git_cmd = self.git_repo.git
+        for fstr, oid in fstr2oid.items():
+            try:
+                stream = git_cmd.stream_object_data(oid)[3]
+                line_count = self._count_blob_lines(stream)
+            except UnicodeDecodeError as e:
+                logger.warning(f"Could not read file {fstr}: {e}")
+                line_count = 0
+            except Exception as e:
+                logger.warning(f"Could not read file {fstr}: {e}")
+                # The cat-file pipe may be left partway through the blob, so the
+                # persistent process is restarted for the next blob
+                git_cmd.clear_cache()
+                line_count = 0
+            self.fstr2line_count[fstr] = line_count
+            self.fstr2line_count["*"] += line_count
+
+    @staticmethod
+    def _count_blob_lines(stream: IO[bytes]) -> int:
+        """Count the lines of a UTF-8 blob without holding it in memory.
+
+        The blob is read in chunks and always to its end, also on error, so that
+        the cat-file pipe it comes from stays in sync for the next blob.
+
+        Args:
+            stream: Content stream of the blob
+
+        Returns:
+            Number of newlines plus one
+
+        Raises:
+            UnicodeDecodeError: If the blob is not valid UTF-8
+
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        line_count = 1
+        try:
+            while chunk := stream.read(BLOB_READ_SIZE):
+                decoder.decode(chunk)
+                line_count += chunk.count(b"\n")
+            decoder.decode(b"", final=True)
+        finally:
+            while stream.read(BLOB_READ_SIZE):
+                pass
+        return line_count
 
     def _get_commits_first_pass(self) -> None:
         """Process commits in the specified date range (first pass).
@@ -551,7 +653,8 @@ class RepoBase:
         if self.head_oid:
             args += [
                 f"{self.head_oid}",
-                "--pretty=format:%h%n%ct%n%s%n%aN%n%aE%n",
+                "-z",  # Separate commits by NUL instead of newline
+                "--pretty=format:%h%x00%ct%x00%s%x00%aN%x00%aE",
             ]
         else:
             logger.error("Head OID not set")
@@ -562,56 +665,63 @@ class RepoBase:
             return
 
         try:
-            lines_str: str = self.git_repo.git.log(*args)
+            # Stream the output instead of reading it into one string
+            process = self.git_repo.git.log(*args, as_process=True)
         except Exception as e:
             logger.exception(f"Git log command failed: {e}")
             return
 
-        lines = lines_str.splitlines()
-        i: int = 0
-
-        while i < len(lines) - 4:
-            line = lines[i]
-            if not line:
-                i += 1
-                continue
-
-            sha = line
-            oid = self.sha2oid.get(sha)
+        # Each commit is a record of 5 NUL-separated fields: sha, timestamp,
+        # subject, author, email. Subjects are only decoded when they are matched.
+        # Bind everything the loop touches per commit to locals
+        ex_messages_re = self._ex_messages_re
+        ex_revisions: tuple[Rev, ...] = tuple(self.ex_revisions)
+        sha2oid_get = self.sha2oid.get
+        sha2nr_get = self.sha2nr.get
+        sha2author = self.sha2author
+        # Distinct author/email pairs in first-seen order, added to persons_db
+        # after the loop instead of once per commit
+        author_emails: dict[tuple[Author, Email], None] = {}
+        add_sha_date_nr = sha_date_nrs.append
+        fields = self._iter_nul_fields(process.stdout)
+        for sha_bytes, timestamp_bytes, message_bytes, author_bytes, email_bytes in zip(
+            *[iter(fields)] * 5
+        ):
+            sha = sha_bytes.decode("ascii")
+            oid = sha2oid_get(sha)
             if not oid:
-                i += 5
                 continue
 
             # Check for excluded revisions
-            if any(oid.startswith(rev) for rev in self.ex_revisions):
+            if oid.startswith(ex_revisions):
                 ex_shas.add(sha)
-                i += 5
                 continue
 
-            timestamp = int(lines[i + 1])
-            message = lines[i + 2]
-
             # Check for excluded messages
-            if any(
-                fnmatchcase(message.lower(), pattern.lower())
-                for pattern in self.args.ex_messages
-            ):
-                ex_shas.add(sha)
-                i += 5
-                continue
+            if ex_messages_re is not None:
+                message = message_bytes.decode("utf-8", "surrogateescape").lower()
+                if ex_messages_re.match(message):
+                    ex_shas.add(sha)
+                    continue
 
-            author = lines[i + 3]
-            email = lines[i + 4]
+            author = author_bytes.decode("utf-8", "surrogateescape")
+            email = email_bytes.decode("utf-8", "surrogateescape")
+            timestamp = int(timestamp_bytes)
 
-            # Add person to database
-            self.persons_db.add_person(author, email)
-            self.sha2author[sha] = author
+            author_emails[author, email] = None
+            sha2author[sha] = author
 
             # Create SHA-date-number entry
-            sha_date_nr = SHADateNr(sha, timestamp, self.sha2nr.get(sha, 0))
-            sha_date_nrs.append(sha_date_nr)
+            add_sha_date_nr(SHADateNr(sha, timestamp, sha2nr_get(sha, 0)))
+
+        try:
+            process.wait()
+        except Exception as e:
+            logger.exception(f"Git log command failed: {e}")
+            return
 
-            i += 5
+        # Add persons to database
+        self.persons_db.add_persons_bulk(author_emails)
 
         # Sort by date and store results
         sha_date_nrs.sort(key=lambda x: x.date)
@@ -619,6 +729,28 @@ class RepoBase:
         self.sha_since_until_nrs = [sha_date_nr.nr for sha_date_nr in sha_date_nrs]
         self.ex_shas = ex_shas
 
+    @staticmethod
+    def _iter_nul_fields(
+        stream: IO[bytes], read_size: int = GIT_LOG_READ_SIZE
+    ) -> Iterator[bytes]:
+        """Yield the NUL-separated fields of a byte stream as they arrive.
+
+        Args:
+            stream: Binary stream, e.g. the stdout of a git process
+            read_size: Number of bytes to read from the stream at a time
+
+        Yields:
+            Fields of the stream, without the NUL separators
+
+        """
+        rest = b""
+        while chunk := stream.read(read_size):
+            fields = (rest + chunk).split(b"\x00")
+            rest = fields.pop()
+            yield from fields
+        if rest:
+            yield rest
+
     def _get_since_until_args(self) -> list[str]:
         """Get git log arguments for date filtering.
 
@@ -640,23 +772,53 @@ class RepoBase:
     def _set_fstr2commits(self) -> None:
         """Set file-to-commits mapping with threading support.
 
-        This method processes git log for each file to build commit groups.
-        It supports both single-threaded and multi-threaded execution.
+        Files that were never renamed are processed in chunks, with a single
+        git log call per chunk of files. Only files that received their current
+        name through a rename need a git log call of their own, because
+        ``--follow`` accepts a single file only. The git log calls run in a
+        thread pool when multithreading is enabled.
         """
 
         def reduce_commits() -> None:
-            """Remove duplicate commits from the end of commit lists."""
-            fstrs = copy.deepcopy(self.fstrs)
+            """Remove duplicate commits from the end of commit lists.
+
+            Only files whose last commit group equals the last commit group of
+            the longer file can share a tail with it, so the remaining files are
+            bucketed by the key of their last commit group.
+            """
+
+            def group_key(commit_group: CommitGroup) -> tuple:
+                return (
+                    commit_group.fstr,
+                    commit_group.author,
+                    commit_group.insertions,
+                    commit_group.deletions,
+                    commit_group.date_sum,
+                    frozenset(commit_group.shas),
+                )
+
+            fstrs = list(self.fstrs)
             fstrs.sort(key=lambda x: len(self.fstr2commit_groups.get(x, [])))
 
+            fstr2key: dict[FileStr, tuple] = {}
+            key2fstrs: dict[tuple, set[FileStr]] = {}
+            for fstr in fstrs:
+                commit_groups = self.fstr2commit_groups.get(fstr)
+                if commit_groups:
+                    key = group_key(commit_groups[-1])
+                    fstr2key[fstr] = key
+                    key2fstrs.setdefault(key, set()).add(fstr)
+
             while fstrs:
                 fstr1 = fstrs.pop()
+                if fstr1 in fstr2key:
+                    key2fstrs[fstr2key.pop(fstr1)].discard(fstr1)
                 commit_groups1 = self.fstr2commit_groups.get(fstr1, [])
                 if not commit_groups1:
                     continue
 
-                for fstr2 in fstrs:
-                    commit_groups2 = self.fstr2commit_groups.get(fstr2, [])
+                for fstr2 in list(key2fstrs.get(group_key(commit_groups1[-1]), ())):
+                    commit_groups2 = self.fstr2commit_groups[fstr2]
                     i = -1
                     while (
                         commit_groups2
@@ -666,109 +828,390 @@ class RepoBase:
                         commit_groups2.pop()
                         i -= 1
 
-        i_max: int = len(self.fstrs)
+                    # Move fstr2 to the bucket of its new last commit group
+                    key2fstrs[fstr2key.pop(fstr2)].discard(fstr2)
+                    if commit_groups2:
+                        key = group_key(commit_groups2[-1])
+                        fstr2key[fstr2] = key
+                        key2fstrs.setdefault(key, set()).add(fstr2)
+
+        def get_commit_groups(
+            task_fstrs: list[FileStr], follow: bool
+        ) -> CommitGroupsDict:
+            """Run git log for a task and return its commit groups per file."""
+            if follow:
+                lines_str, fstr = self._get_commit_lines_for(task_fstrs[0])
+                return {fstr: self._process_commit_lines_for(lines_str, fstr)}
+            lines_str = self._get_commit_lines_for_fstrs(task_fstrs)
+            return self._process_commit_lines_for_fstrs(lines_str, task_fstrs)
+
+        def log_progress(task_fstr2commit_groups: CommitGroupsDict) -> None:
+            """Log progress for each file of a finished task."""
+            nonlocal i
+            for fstr in task_fstr2commit_groups:
+                i += 1
+                if self.args.verbosity == 0 and not self.args.multicore:
+                    self.log_dot()
+                else:
+                    logger.info(f"{prefix}log {i} of {i_max}: {self.name}: {fstr}")
+
+        fstrs: list[FileStr] = self.fstrs
+        i_max: int = len(fstrs)
         i: int = 0
         chunk_size: int = GIT_LOG_CHUNK_SIZE
         prefix: str = " " * 8
 
         logger.info(f"{prefix}Git log: {self.name}: {i_max} files")
 
+        renamed_fstrs = self._get_renamed_fstrs()
+        bulk_fstrs = [fstr for fstr in fstrs if fstr not in renamed_fstrs]
+        tasks: list[tuple[list[FileStr], bool]] = [
+            (bulk_fstrs[start : start + chunk_size], False)
+            for start in range(0, len(bulk_fstrs), chunk_size)
+        ]
+        tasks += [([fstr], True) for fstr in fstrs if fstr in renamed_fstrs]
+
+        fstr2commit_groups: CommitGroupsDict = {}
+        self.log_space(8)
         if self.args.multithread:
-            self.log_space(8)
             with ThreadPoolExecutor(max_workers=MAX_THREAD_WORKERS) as thread_executor:
-                for chunk_start in range(0, i_max, chunk_size):
-                    chunk_end = min(chunk_start + chunk_size, i_max)
-                    chunk_fstrs = self.fstrs[chunk_start:chunk_end]
-
-                    futures = [
-                        thread_executor.submit(self._get_commit_lines_for, fstr)
-                        for fstr in chunk_fstrs
-                    ]
-
-                    for future in as_completed(futures):
-                        try:
-                            lines_str, fstr = future.result()
-                            i += 1
-
-                            if self.args.verbosity == 0:
-                                self.log_dot()
-                            else:
-                                logger.info(
-                                    f"{prefix}log {i} of {i_max}: {self.name}: {fstr}"
-                                    if self.args.multicore
-                                    else f"{fstr}"
-                                )
-
-                            self.fstr2commit_groups[fstr] = (
-                                self._process_commit_lines_for(lines_str, fstr)
-                            )
-                        except Exception as e:
-                            logger.exception(f"Error processing file {fstr}: {e}")
+                future2task = {
+                    thread_executor.submit(get_commit_groups, task_fstrs, follow): (
+                        task_fstrs
+                    )
+                    for task_fstrs, follow in tasks
+                }
+                for future in as_completed(future2task):
+                    try:
+                        task_fstr2commit_groups = future.result()
+                    except Exception as e:
+                        logger.exception(
+                            f"Error processing files {future2task[future]}: {e}"
+                        )
+                        continue
+                    log_progress(task_fstr2commit_groups)
+                    fstr2commit_groups.update(task_fstr2commit_groups)
+            self.close_thread_git_repos()
         else:
             # Single-threaded processing
-            self.log_space(8)
-            for fstr in self.fstrs:
+            for task_fstrs, follow in tasks:
                 try:
-                    lines_str, fstr = self._get_commit_lines_for(fstr)
-                    i += 1
-
-                    if self.args.verbosity == 0 and not self.args.multicore:
-                        self.log_dot()
-                    else:
-                        logger.info(f"{prefix}{i} of {i_max}: {self.name} {fstr}")
-
-                    self.fstr2commit_groups[fstr] = self._process_commit_lines_for(
-                        lines_str, fstr
-                    )
+                    task_fstr2commit_groups = get_commit_groups(task_fstrs, follow)
                 except Exception as e:
-                    logger.exception(f"Error processing file {fstr}: {e}")
+                    logger.exception(f"Error processing files {task_fstrs}: {e}")
+                    continue
+                log_progress(task_fstr2commit_groups)
+                fstr2commit_groups.update(task_fstr2commit_groups)
+
+        # Store the commit groups in file order, independent of task completion
+        for fstr in fstrs:
+            if fstr in fstr2commit_groups:
+                self.fstr2commit_groups[fstr] = fstr2commit_groups[fstr]
 
         self.log_space(2)
         reduce_commits()
 
-    def _get_commit_lines_for(self, fstr: FileStr) -> tuple[str, FileStr]:
-        """Get git log output for a specific file.
+    def _get_renamed_fstrs(self) -> set[FileStr]:
+        """Get the files that received their current name through a rename.
 
-        Args:
-            fstr: File string to get commits for
+        Only these files need to be followed individually across renames. The
+        renames are taken from the single rename tracking pass of
+        _build_all_sha2f.
 
         Returns:
-            Tuple of (git log output, file string)
+            Set of file strings that are the target of a rename in the history
 
         """
+        self._build_all_sha2f()
+        return self._renamed_fstrs  # type: ignore
+
+    def _build_all_sha2f(self) -> None:
+        """Build the SHA-to-filename mappings of all files in a single git log pass.
+
+        Emulates ``git log --follow --name-status`` for every file at once. The
+        history is walked from new to old with rename detection, from the
+        analyzed HEAD commit and within the since and until limits of the first
+        pass. Each rename moves the tracked name of a file to its name before the
+        rename. If the git log call fails, all files are marked as renamed and
+        the mappings are left unset, so that every file falls back to being
+        followed on its own.
+        """
+        if self._renamed_fstrs is not None:
+            return
 
-        def git_log_args() -> list[str]:
-            """Build git log arguments for file analysis."""
-            args = self._get_since_until_args()
-            if not self.args.whitespace:
-                args.append("-w")
-            args += [
-                f"{self.head_oid}",
-                "--follow",
-                "--numstat",  # insertions \t deletions \t file_name
-                "--pretty=format:%n%h%n%ct%n%aN",
-                "--",  # Separate revisions from files
-                str(fstr),
-            ]
-            return args
+        fstrs: list[FileStr] = self.fstrs
+        if not self.git_repo or not self.head_oid:
+            self._renamed_fstrs = set()
+            return
+
+        try:
+            # Records start with \x1e and end the sha with \x1f, -z separates the
+            # status and file names by NUL
+            log_str: str = self.git_repo.git.log(
+                *self._get_since_until_args(),
+                self.head_oid,
+                "-z",
+                "-M",
+                "--name-status",
+                "--pretty=format:%x1e%h%x1f",
+            )
+        except Exception as e:
+            logger.exception(f"Git log for rename tracking failed: {e}")
+            self._renamed_fstrs = set(fstrs)
+            return
+
+        fstr2sha2f: dict[FileStr, dict[SHA, FileStr]] = {fstr: {} for fstr in fstrs}
+        renamed_fstrs: set[FileStr] = set()
+        # Files currently tracked under each name, going back in history
+        name2roots: dict[FileStr, list[FileStr]] = {fstr: [fstr] for fstr in fstrs}
+        # SHA, file name and status of the oldest commit of each file
+        root2oldest: dict[FileStr, tuple[SHA, FileStr, str]] = {}
+        for record in log_str.split("\x1e")[1:]:
+            sha, _, changes = record.partition("\x1f")
+            # status and file name, for renames and copies followed by a new name
+            tokens = changes.lstrip("\n").split("\0")
+            i = 0
+            while i < len(tokens) - 1:
+                status = tokens[i]
+                if status.startswith(("R", "C")):
+                    old_fstr, new_fstr = tokens[i + 1], tokens[i + 2]
+                    i += 3
+                    if status[0] != "R" or new_fstr not in name2roots:
+                        continue
+                    # Handle rename commit
+                    roots = name2roots.pop(new_fstr)
+                    for root in roots:
+                        fstr2sha2f[root][sha] = new_fstr
+                        renamed_fstrs.add(root)
+                        root2oldest[root] = (sha, old_fstr, "R")
+                    name2roots.setdefault(old_fstr, []).extend(roots)
+                else:
+                    for root in name2roots.get(tokens[i + 1], ()):
+                        root2oldest[root] = (sha, tokens[i + 1], status[0])
+                    i += 2
+
+        # The oldest commit of each file gives its first name: at its addition,
+        # or before the since date for a file that already existed then
+        for root, (sha, fstr, status) in root2oldest.items():
+            if status != "R":
+                fstr2sha2f[root][sha] = fstr
+            if status != "A":
+                fstr2sha2f[root][PRE_RANGE_SHA] = fstr
+        # Files without commits in the range keep a single name
+        for fstr, roots in name2roots.items():
+            for root in roots:
+                if root not in root2oldest:
+                    fstr2sha2f[root][PRE_RANGE_SHA] = fstr
+
+        self._all_sha2f = fstr2sha2f
+        self._renamed_fstrs = renamed_fstrs
+
+    def _run_git_log(self, args: list[str], description: str) -> str:
+        """Run git log, using a separate repo instance when multithreading.
 
+        Args:
+            args: Arguments for git log
+            description: Description of the call for error messages
+
+        Returns:
+            Git log output, or an empty string if git log failed
+
+        """
         lines_str: str = ""
 
         if self.args.multithread:
             # Use separate git repo instance for thread safety
             try:
-                git_repo = GitRepo(self.location)
-                lines_str = git_repo.git.log(*git_log_args())
-                git_repo.close()
+                lines_str = self.get_thread_git_repo().git.log(*args)
             except Exception as e:
-                logger.exception(f"Git log failed for file {fstr}: {e}")
+                logger.exception(f"Git log failed for {description}: {e}")
         elif self.git_repo:
             try:
-                lines_str = self.git_repo.git.log(*git_log_args())
+                lines_str = self.git_repo.git.log(*args)
             except Exception as e:
-                logger.exception(f"Git log failed for file {fstr}: {e}")
+                logger.exception(f"Git log failed for {description}: {e}")
 
-        return lines_str, fstr
+        return lines_str
+
+    def _get_commit_lines_for(self, fstr: FileStr) -> tuple[str, FileStr]:
+        """Get git log output for a specific file, following renames.
+
+        Each commit record starts with \x1e, followed by the sha, timestamp and
+        author lines and a NUL terminated numstat entry. For a rename, the
+        entry has an empty file name, followed by the old and new file names.
+
+        Args:
+            fstr: File string to get commits for
+
+        Returns:
+            Tuple of (git log output, file string)
+
+        """
+        args = self._get_since_until_args()
+        if not self.args.whitespace:
+            args.append("-w")
+        args += [
+            f"{self.head_oid}",
+            "--follow",
+            "-z",  # Terminate numstat entries by NUL, without quoting
+            "--numstat",  # insertions \t deletions \t file_name
+            "--pretty=format:%x1e%h%n%ct%n%aN",
+            "--",  # Separate revisions from files
+            str(fstr),
+        ]
+        return self._run_git_log(args, f"file {fstr}"), fstr
+
+    def _get_commit_lines_for_fstrs(self, fstrs: list[FileStr]) -> str:
+        """Get git log output for a chunk of files in a single call.
+
+        Each commit record starts with \x1e, followed by the sha, timestamp and
+        author lines and one NUL terminated numstat entry per file of the chunk
+        that the commit changed. With -z, git does not quote file names with
+        non-ASCII or special characters, so they match the names in fstrs.
+
+        Args:
+            fstrs: File strings to get commits for
+
+        Returns:
+            Git log output
+
+        """
+        args = self._get_since_until_args()
+        if not self.args.whitespace:
+            args.append("-w")
+        args += [
+            f"{self.head_oid}",
+            "--no-renames",
+            # Like --follow, do not prune the side branches of merges that are
+            # TREESAME to a parent for the files of the chunk
+            "--full-history",
+            "-z",  # Terminate numstat entries by NUL, without quoting
+            "--numstat",  # insertions \t deletions \t file_name
+            "--pretty=format:%x1e%h%n%ct%n%aN",
+            "--",  # Separate revisions from files
+            *fstrs,
+        ]
+        return self._run_git_log(args, f"{len(fstrs)} files")
+
+    @staticmethod
+    def _add_to_commit_groups(
+        commit_groups: list[CommitGroup],
+        fstr: FileStr,
+        author: str,
+        insertions: int,
+        deletions: int,
+        timestamp: UnixTimestamp,
+        sha: SHA,
+    ) -> None:
+        """Add a commit to the commit groups of a file.
+
+        The commit is merged into the last commit group if that group has the
+        same file and author, otherwise a new commit group is appended. While
+        the groups are built, their shas are collected in a list, see
+        _freeze_commit_groups.
+        """
+        if (
+            len(commit_groups) > 0
+            and fstr == commit_groups[-1].fstr
+            and author == commit_groups[-1].author
+        ):
+            commit_groups[-1].date_sum += timestamp * insertions
+            commit_groups[-1].shas.append(sha)  # type: ignore
+            commit_groups[-1].insertions += insertions
+            commit_groups[-1].deletions += deletions
+        else:
+            # Create new commit group
+            commit_group = CommitGroup(
+                fstr=fstr,
+                author=author,
+                insertions=insertions,
+                deletions=deletions,
+                date_sum=timestamp * insertions,
+                shas=[sha],  # type: ignore
+            )
+            commit_groups.append(commit_group)
+
+    @staticmethod
+    def _freeze_commit_groups(commit_groups: list[CommitGroup]) -> None:
+        """Turn the sha lists of completed commit groups into frozensets.
+
+        Args:
+            commit_groups: Commit groups built by _add_to_commit_groups
+
+        """
+        for commit_group in commit_groups:
+            commit_group.shas = frozenset(commit_group.shas)
+
+    def _process_commit_lines_for_fstrs(
+        self, lines_str: str, fstrs: list[FileStr]
+    ) -> CommitGroupsDict:
+        """Process git log output for a chunk of files into commit groups.
+
+        Args:
+            lines_str: Git log output from _get_commit_lines_for_fstrs
+            fstrs: File strings of the chunk
+
+        Returns:
+            Dictionary mapping each file of the chunk to its commit groups
+
+        """
+        fstr2commit_groups: CommitGroupsDict = {fstr: [] for fstr in fstrs}
+        filter_cache = self._author_filter_cache
+
+        for record in lines_str.split("\x1e")[1:]:
+            # sha, timestamp and author lines, followed by the numstat entries.
+            # Records without entries, like merge commits, end in NUL after the
+            # author.
+            lines = record.rstrip("\0").split("\n", 3)
+            if len(lines) < 3:
+                continue
+
+            sha = lines[0]
+            if sha in self.ex_shas:
+                logger.debug(f"Excluding commit {sha}")
+                continue
+
+            timestamp = int(lines[1])
+            author = lines[2]
+
+            # Check if person is filtered
+            filter_matched = filter_cache.get(author)
+            if filter_matched is None:
+                filter_matched = self.persons_db[author].filter_matched
+                filter_cache[author] = filter_matched
+            if filter_matched:
+                continue
+
+            stat_lines = lines[3].split("\0") if len(lines) > 3 else []
+            for stat_line in stat_lines:
+                if not stat_line:
+                    continue
+
+                # Parse stat line (insertions \t deletions \t filename), the
+                # file name itself may contain tabs
+                parts = stat_line.split("\t", 2)
+                if len(parts) != 3:
+                    logger.warning(f"Invalid stat line: {stat_line}")
+                    continue
+
+                try:
+                    insertions = int(parts[0])
+                    deletions = int(parts[1])
+                    fstr = parts[2]
+                except ValueError as e:
+                    logger.warning(f"Error parsing stat line {stat_line}: {e}")
+                    continue
+
+                commit_groups = fstr2commit_groups.get(fstr)
+                if commit_groups is None:
+                    continue
+                self._add_to_commit_groups(
+                    commit_groups, fstr, author, insertions, deletions, timestamp, sha
+                )
+
+        for commit_groups in fstr2commit_groups.values():
+            self._freeze_commit_groups(commit_groups)
+        return fstr2commit_groups
 
     def _process_commit_lines_for(
         self, lines_str: str, fstr_root: FileStr
@@ -784,98 +1227,55 @@ class RepoBase:
 
         """
         commit_groups: list[CommitGroup] = []
-        lines: list[str] = lines_str.strip().splitlines()
+        filter_cache = self._author_filter_cache
 
-        # Regex patterns for file renames
-        rename_pattern = re.compile(r"^(.*)\{(.*) => (.*)\}(.*)$")
-        simple_rename_pattern = re.compile(r"^(.*) => (.*)$")
-
-        i: int = 0
-        while i < len(lines):
-            line = lines[i]
-            if not line:
-                i += 1
+        for record in lines_str.split("\x1e")[1:]:
+            # sha, timestamp and author lines, followed by the numstat entry
+            lines = record.rstrip("\0").split("\n", 3)
+            if len(lines) < 4:
                 continue
+            sha, timestamp_str, author, stat_entry = lines
 
-            sha = line
             if sha in self.ex_shas:
                 logger.debug(f"Excluding commit {sha}")
-                i += 4
                 continue
 
-            if i + 3 >= len(lines):
-                break
-
-            timestamp = int(lines[i + 1])
-            author = lines[i + 2]
-
             # Check if person is filtered
-            person = self.persons_db[author]
-            if person.filter_matched:
-                i += 4
-                continue
-
-            if i + 3 >= len(lines):
-                break
-
-            stat_line = lines[i + 3]
-            if not stat_line:
-                i += 4
+            filter_matched = filter_cache.get(author)
+            if filter_matched is None:
+                filter_matched = self.persons_db[author].filter_matched
+                filter_cache[author] = filter_matched
+            if filter_matched:
                 continue
 
-            # Parse stat line (insertions \t deletions \t filename)
-            parts = stat_line.split("\t")
+            # Parse stat entry (insertions \t deletions \t filename), for renames
+            # followed by the old and new file names
+            fields = stat_entry.split("\0")
+            parts = fields[0].split("\t", 2)
             if len(parts) != 3:
-                logger.warning(f"Invalid stat line: {stat_line}")
-                i += 4
+                logger.warning(f"Invalid stat line: {fields[0]}")
                 continue
 
             try:
                 insertions = int(parts[0])
                 deletions = int(parts[1])
-                file_name = parts[2]
             except ValueError as e:
-                logger.warning(f"Error parsing stat line {stat_line}: {e}")
-                i += 4
+                logger.warning(f"Error parsing stat line {fields[0]}: {e}")
                 continue
 
-            # Handle file renames
-            fstr = file_name
-            match = rename_pattern.match(file_name)
-            if match:
-                prefix = match.group(1)
-                new_part = match.group(3)
-                suffix = match.group(4)
-                fstr = f"{prefix}{new_part}{suffix}".replace("//", "/")
-            else:
-                match = simple_rename_pattern.match(file_name)
-                if match:
-                    fstr = match.group(2)
+            # Handle file renames, the commit counts for the new file name
+            fstr = parts[2]
+            if not fstr and len(fields) >= 3:
+                fstr = fields[2]
 
-            # Merge with previous commit group if same file and author
-            if (
-                len(commit_groups) > 0
-                and fstr == commit_groups[-1].fstr
-                and author == commit_groups[-1].author
-            ):
-                commit_groups[-1].date_sum += timestamp * insertions
-                commit_groups[-1].shas.add(sha)
-                commit_groups[-1].insertions += insertions
-                commit_groups[-1].deletions += deletions
-            else:
-                # Create new commit group
-                commit_group = CommitGroup(
-                    fstr=fstr,
-                    author=author,
-                    insertions=insertions,
-                    deletions=deletions,
-                    date_sum=timestamp * insertions,
-                    shas={sha},
-                )
-                commit_groups.append(commit_group)
+            timestamp = int(timestamp_str)
 
-            i += 4
+            # Merge with previous commit group if same file and author
+            self._add_to_commit_groups(
+                commit_groups, fstr, author, insertions, deletions, timestamp, sha
+            )
 
+        self._freeze_commit_groups(commit_groups)
         return commit_groups
 
     def dynamic_blame_history_selected(self) -> bool:
@@ -884,26 +1284,45 @@ class RepoBase:
 
     def _set_fr2sha2f(self) -> None:
         """Set file rename mapping by SHA."""
-        for fstr in self.fstrs:
-            self.fr2sha2f[fstr] = self._get_sha2f_for_fstr(fstr)
+        self._build_all_sha2f()
+        all_sha2f = self._all_sha2f or {}
+        fstrs = self.fstrs
+        for fstr in fstrs:
+            sha2f = all_sha2f.get(fstr)
+            if sha2f is None:
+                sha2f = self._get_sha2f_for_fstr(fstr)
+            self.fr2sha2f[fstr] = sha2f
 
     def _set_fr2sha_nr2f(self) -> None:
         """Set file rename mapping by commit number."""
-        for fstr in self.fstrs:
-            if fstr not in self.fr2sha_nr2f:
-                self.fr2sha_nr2f[fstr] = {}
-            for sha, new_fstr in self.fr2sha2f[fstr].items():
-                sha_nr = self.sha2nr.get(sha, 0)
-                self.fr2sha_nr2f[fstr][sha_nr] = new_fstr
+        sha2nr = self.sha2nr.get
+        self.fr2sha_nr2f = {
+            fstr: {
+                sha2nr(sha, 0): new_fstr
+                for sha, new_fstr in self.fr2sha2f[fstr].items()
+            }
+            for fstr in self.fstrs
+        }
 
     def _set_fr2sha_nrs(self) -> None:
         """Set sorted commit numbers for file renames."""
-        for fstr in self.fstrs:
-            nrs = sorted(self.fr2sha_nr2f[fstr].keys(), reverse=True)
-            self.fr2sha_nrs[fstr] = nrs
+        self.fr2sha_nrs = {
+            fstr: sorted(sha_nr2f, reverse=True)
+            for fstr, sha_nr2f in self.fr2sha_nr2f.items()
+        }
+        self._fr2sha_nrs_asc = {
+            fstr: nrs[::-1] for fstr, nrs in self.fr2sha_nrs.items()
+        }
+        self._fr2newest = {
+            fstr: (nrs[0], self.fr2sha_nr2f[fstr][nrs[0]])
+            for fstr, nrs in self.fr2sha_nrs.items()
+            if nrs
+        }
 
     def _get_sha2f_for_fstr(self, root_fstr: FileStr) -> dict[SHA, FileStr]:
-        """Get SHA-to-filename mapping for file rename tracking.
+        """Get SHA-to-filename mapping for file rename tracking of a single file.
+
+        Used when the rename tracking pass over all files is not available.
 
         Args:
             root_fstr: Root file string to track renames for
@@ -918,40 +1337,33 @@ class RepoBase:
             return sha2f
 
         try:
-            lines: list[str] = self.git_repo.git.log(
-                "--pretty=format:%h", "--follow", "--name-status", "--", root_fstr
-            ).splitlines()
+            # Records start with \x1e and end the sha with \x1f, -z separates the
+            # status and file names by NUL
+            log_str: str = self.git_repo.git.log(
+                "-z",
+                "--pretty=format:%x1e%h%x1f",
+                "--follow",
+                "--name-status",
+                "--",
+                root_fstr,
+            )
         except Exception as e:
             logger.exception(f"Git log failed for file rename tracking {root_fstr}: {e}")
             return sha2f
 
-        i: int = 0
-        while i < len(lines):
-            line = lines[i]
-            if not line:
-                i += 1
+        records: list[str] = log_str.split("\x1e")[1:]
+        for i, record in enumerate(records):
+            sha, _, changes = record.partition("\x1f")
+            # status, file name and for renames and copies the new file name
+            tokens = changes.lstrip("\n").split("\0")
+            if len(tokens) < 2:
                 continue
-
-            if i == len(lines) - 2:
+            if i == len(records) - 1:
                 # Get the last element (file addition)
-                sha = line.strip()
-                if i + 1 < len(lines):
-                    parts = lines[i + 1].split("\t")
-                    if len(parts) >= 2:
-                        new_fstr = parts[1]
-                        sha2f[sha] = new_fstr.strip()
-                break
-
-            if "\t" not in line and i + 1 < len(lines) and lines[i + 1].startswith("R"):
+                sha2f[sha] = tokens[1]
+            elif tokens[0].startswith("R") and len(tokens) >= 3:
                 # Handle rename commit
-                sha = line.strip()
-                parts = lines[i + 1].split("\t")
-                if len(parts) >= 3:
-                    new_fstr = parts[2]
-                    sha2f[sha] = new_fstr.strip()
-                i += 2
-            else:
-                i += 2
+                sha2f[sha] = tokens[2]
 
         return sha2f
 
@@ -966,33 +1378,90 @@ class RepoBase:
             File name at the specified commit, or empty string if not found
 
         """
-        sha_nr: int = self.sha2nr.get(sha, 0)
+        return self.get_fstr_for_sha_nr(root_fstr, self.sha2nr.get(sha, 0))
+
+    def get_fstr_for_sha_nr(self, root_fstr: FileStr, sha_nr: int) -> FileStr:
+        """Get file name for a commit number in the file's rename history.
 
+        Same as get_fstr_for_sha, for callers that already have the commit
+        number of the SHA.
+
+        Args:
+            root_fstr: Root file string
+            sha_nr: Commit number to get file name for
+
+        Returns:
+            File name at the specified commit, or empty string if not found
+
+        """
         if root_fstr not in self.fr2sha_nr2f:
             return ""
 
-        nrs: list[int] = sorted(self.fr2sha_nr2f[root_fstr].keys(), reverse=True)
+        # Fast path for the newest name, e.g. for lookups at the HEAD commit
+        newest = self._fr2newest.get(root_fstr)
+        if newest is not None and sha_nr >= newest[0]:
+            return newest[1]
+
+        nrs: list[int] | None = self._fr2sha_nrs_asc.get(root_fstr)
+        if nrs is None:
+            nrs = sorted(self.fr2sha_nr2f[root_fstr])
+            self._fr2sha_nrs_asc[root_fstr] = nrs
         if not nrs:
             msg = f"No entries found for {root_fstr}."
             raise ValueError(msg)
 
-        for nr in nrs:
-            if nr <= sha_nr:
-                return self.fr2sha_nr2f[root_fstr][nr]
-
-        # sha_nr smaller than the smallest sha nr in the list
-        return ""
+        # Largest sha nr in the list that is not larger than sha_nr
+        i = bisect_right(nrs, sha_nr) - 1
+        if i < 0:
+            # sha_nr smaller than the smallest sha nr in the list
+            return ""
+        return self.fr2sha_nr2f[root_fstr][nrs[i]]
 
     def log_dot(self) -> None:
-        """Log a dot for progress indication."""
-        print(".", end="", flush=True)
+        """Log a dot for progress indication.
+
+        Stdout is flushed once every LOG_DOT_FLUSH_INTERVAL dots instead of per
+        dot, and by log_space at the end of each progress line.
+        """
+        sys.stdout.write(".")
+        self._dot_count += 1
+        if self._dot_count >= LOG_DOT_FLUSH_INTERVAL:
+            self._dot_count = 0
+            sys.stdout.flush()
 
     def log_space(self, i: int) -> None:
         """Log spaces for formatting."""
-        print(" " * i, end="", flush=True)
+        sys.stdout.write(" " * i)
+        self._dot_count = 0
+        sys.stdout.flush()
+
+    def get_thread_git_repo(self) -> GitRepo:
+        """Get the git repo instance of the current worker thread.
+
+        The instance is created on first use in a thread and reused for all
+        later tasks of that thread.
+
+        Returns:
+            GitPython repository object owned by the current thread
+
+        """
+        git_repo: GitRepo | None = getattr(self._thread_local, "git_repo", None)
+        if git_repo is None:
+            git_repo = GitRepo(self.location)
+            self._thread_local.git_repo = git_repo
+            self._thread_git_repos.append(git_repo)
+        return git_repo
+
+    def close_thread_git_repos(self) -> None:
+        """Close the git repo instances created by worker threads."""
+        for git_repo in self._thread_git_repos:
+            git_repo.close()
+        self._thread_git_repos = []
+        self._thread_local = threading.local()
 
     def close(self) -> None:
         """Close the git repository to free resources."""
+        self.close_thread_git_repos()
         if self.git_repo:
             self.git_repo.close()
             self.git_repo = None
@@ -1020,13 +1489,17 @@ class RepoBase:
                     f"Not a git repository (no .git directory): {self.location}",
                 )
 
-            # Try to initialize git repo to validate
-            try:
-                test_repo = GitRepo(self.location)
-                test_repo.close()
-                return True, ""
-            except Exception as e:
-                return False, f"Invalid git repository: {e}"
+            # Check the git directory the way GitRepo does, without constructing
+            # a repository object. A .git file points to the git directory of a
+            # worktree or submodule.
+            git_dir_str: str | None = (
+                find_submodule_git_dir(str(git_dir))
+                if git_dir.is_file()
+                else str(git_dir)
+            )
+            if git_dir_str is None or not is_git_dir(git_dir_str):
+                return False, f"Invalid git repository: {self.location}"
+            return True, ""
 
         except Exception as e:
             return False, f"Repository validation failed: {e}"
@@ -17,7 +17,9 @@ Key Features:
 """
 
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from logging import getLogger
 from math import floor
 from pathlib import Path
@@ -43,7 +45,7 @@ logger = getLogger(__name__)
 NOW = int(time.time())  # current time as Unix timestamp in seconds since epoch
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitGroup:
     """Groups commits by author and file name for aggregated analysis.
 
@@ -57,7 +59,8 @@ class CommitGroup:
         insertions: Total lines inserted
         deletions: Total lines deleted
         date_sum: Sum of Unix timestamps for age calculations
-        shas: Set of commit SHAs in this group
+        shas: Set of commit SHAs in this group, a frozenset once the group is
+            complete
 
     """
 
@@ -66,7 +69,7 @@ class CommitGroup:
     insertions: int
     deletions: int
     date_sum: UnixTimestamp
-    shas: set[SHA]
+    shas: set[SHA] | frozenset[SHA]
 
 
 class Stat:
@@ -82,6 +85,19 @@ class Stat:
     of inserted lines are still present in the current codebase.
     """
 
+    __slots__ = (
+        "_age_cache",
+        "_stability_cache",
+        "blame_line_count",
+        "date_sum",
+        "deletions",
+        "insertions",
+        "percent_deletions",
+        "percent_insertions",
+        "percent_lines",
+        "shas",
+    )
+
     def __init__(self) -> None:
         """Initialize empty statistical data container."""
         self.shas: set[SHA] = set()  # Used to calculate number of commits as len(shas)
@@ -92,40 +108,64 @@ class Stat:
         self.percent_insertions: PercentageValue = 0.0
         self.percent_deletions: PercentageValue = 0.0
         self.percent_lines: PercentageValue = 0.0
+        # Derived values with the field values they were calculated from, as the
+        # fields are also updated directly by the statistics tables
+        self._age_cache: tuple[UnixTimestamp, int, AgeString] | None = None
+        self._stability_cache: tuple[int, int, StabilityMetric] | None = None
 
     @property
     def stability(self) -> StabilityMetric:
         """Calculate stability metric as percentage of inserted lines still present.
 
         Stability indicates code quality - higher values mean more of the
-        inserted code is still present in the current codebase.
+        inserted code is still present in the current codebase. The value is
+        cached until blame_line_count or insertions change.
 
         Returns:
             Stability percentage (0-100) or empty string if no data
 
         """
-        return (
+        cache = self._stability_cache
+        if (
+            cache is not None
+            and cache[0] == self.blame_line_count
+            and cache[1] == self.insertions
+        ):
+            return cache[2]
+        stability = (
             min(100, round(100 * self.blame_line_count / self.insertions))
             if self.insertions and self.blame_line_count
             else ""
         )
+        self._stability_cache = (self.blame_line_count, self.insertions, stability)
+        return stability
 
     @property
     def age(self) -> AgeString:
         """Calculate weighted average age of commits.
 
         Uses insertion-weighted timestamps to provide meaningful age
-        calculations that reflect the actual contribution timeline.
+        calculations that reflect the actual contribution timeline. The value
+        is cached until date_sum or insertions change.
 
         Returns:
             Formatted age string (e.g., "1:02:15" for 1 year, 2 months, 15 days)
 
         """
-        return (
+        cache = self._age_cache
+        if (
+            cache is not None
+            and cache[0] == self.date_sum
+            and cache[1] == self.insertions
+        ):
+            return cache[2]
+        age = (
             self.timestamp_to_age(round(self.date_sum / self.insertions))
             if self.insertions > 0
             else ""
         )
+        self._age_cache = (self.date_sum, self.insertions, age)
+        return age
 
     @property
     def commit_count(self) -> int:
@@ -156,11 +196,11 @@ class Stat:
             other: Another Stat object to merge
 
         """
-        self.shas = self.shas | other.shas
-        self.insertions = self.insertions + other.insertions
-        self.deletions = self.deletions + other.deletions
-        self.date_sum = self.date_sum + other.date_sum
-        self.blame_line_count = self.blame_line_count + other.blame_line_count
+        self.shas |= other.shas  # in place, no new set per merge
+        self.insertions += other.insertions
+        self.deletions += other.deletions
+        self.date_sum += other.date_sum
+        self.blame_line_count += other.blame_line_count
 
     def add_commit_group(self, commit_group: CommitGroup) -> None:
         """Add data from a CommitGroup to this statistic.
@@ -176,6 +216,52 @@ class Stat:
         self.deletions += commit_group.deletions
         self.date_sum += commit_group.date_sum
 
+    @classmethod
+    def from_groups(cls, groups: Iterable[CommitGroup]) -> "Stat":
+        """Create a statistic from many commit groups in a single reduction.
+
+        Gives the same result as calling add_commit_group for each group on an
+        empty Stat, but sums each field once and unions all SHA sets in one
+        call instead of updating the statistic group by group.
+
+        Args:
+            groups: CommitGroups to combine
+
+        Returns:
+            New Stat holding the combined data of all groups
+
+        """
+        groups = list(groups)
+        stat = cls()
+        stat.shas = set().union(*[group.shas for group in groups])
+        stat.insertions = sum(group.insertions for group in groups)
+        stat.deletions = sum(group.deletions for group in groups)
+        stat.date_sum = sum(group.date_sum for group in groups)
+        return stat
+
+    @classmethod
+    def from_stats(cls, stats: Iterable["Stat"]) -> "Stat":
+        """Create a statistic from many statistics in a single reduction.
+
+        Gives the same result as calling add for each statistic on an empty
+        Stat, summing each field once instead of statistic by statistic.
+
+        Args:
+            stats: Stat objects to combine
+
+        Returns:
+            New Stat holding the combined data of all statistics
+
+        """
+        stats = list(stats)
+        stat = cls()
+        stat.shas = set().union(*[other.shas for other in stats])
+        stat.insertions = sum(other.insertions for other in stats)
+        stat.deletions = sum(other.deletions for other in stats)
+        stat.date_sum = sum(other.date_sum for other in stats)
+        stat.blame_line_count = sum(other.blame_line_count for other in stats)
+        return stat
+
     @staticmethod
     def timestamp_to_age(time_stamp: UnixTimestamp) -> AgeString:
         """Convert Unix timestamp to human-readable age string.
@@ -201,6 +287,28 @@ class Stat:
             return f"{years}:{months:02}:{remaining_days:02}"
         return f"{months:02}:{remaining_days:02}"
 
+    @staticmethod
+    def ages(stats: Iterable["Stat"]) -> list[AgeString]:
+        """Calculate the age of many statistics in a single pass.
+
+        Gives the same result as ``[stat.age for stat in stats]``, without the
+        age cache of each Stat, e.g. for all author rows of a report.
+
+        Args:
+            stats: Stat objects to calculate the age for
+
+        Returns:
+            Formatted age string for each Stat, empty if it has no insertions
+
+        """
+        to_age = Stat.timestamp_to_age
+        return [
+            to_age(round(stat.date_sum / stat.insertions))
+            if stat.insertions > 0
+            else ""
+            for stat in stats
+        ]
+
 
 class PersonStat:
     """Statistical data container for a specific person/author.
@@ -255,9 +363,21 @@ class FileStat:
 
         """
         self.fstr: FileStr = fstr
-        self.names: list[FileStr] = []  # Track file renames
+        # Track file renames, an ordered set as a dict with None values
+        self._names: dict[FileStr, None] = {}
+        self._names_tuple: tuple[FileStr, ...] | None = None  # Key for format_names
         self.stat: Stat = Stat()
 
+    @property
+    def names(self) -> list[FileStr]:
+        """All names of the file in order of first appearance."""
+        return list(self._names)
+
+    @names.setter
+    def names(self, names: list[FileStr]) -> None:
+        self._names = dict.fromkeys(names)
+        self._names_tuple = None
+
     def __repr__(self) -> str:
         """Detailed string representation for debugging."""
         s = f"FileStat: {self.names_str()}\n"
@@ -278,8 +398,9 @@ class FileStat:
             name: File name to add to history
 
         """
-        if name not in self.names:
-            self.names.append(name)
+        if name not in self._names:
+            self._names[name] = None
+            self._names_tuple = None
 
     def add_commit_group(self, commit_group: CommitGroup) -> None:
         """Add commit group data to this file's statistics.
@@ -304,16 +425,9 @@ class FileStat:
             Formatted file name string showing renames if enabled
 
         """
-        names = self.names
         if self.fstr == "*":
             return "*"
-        if len(names) == 0:
-            return self.fstr + ": no commits"
-        if not self.show_renames:
-            return self.fstr
-        if self.fstr in names:
-            return " + ".join(names)
-        return self.fstr + ": " + " + ".join(names)
+        return format_names(self._get_names_tuple(), self.fstr, "", self.show_renames)
 
     def relative_names_str(self, subfolder: str) -> str:
         """Get relative file names string for a specific subfolder.
@@ -330,22 +444,18 @@ class FileStat:
         """
         if self.fstr == "*":
             return "*"
+        return format_names(
+            self._get_names_tuple(), self.fstr, subfolder, self.show_renames
+        )
 
-        names = []
-        for name in self.names:
-            names.append(get_relative_fstr(name, subfolder))
-
-        fstr = get_relative_fstr(self.fstr, subfolder)
-        if len(names) == 0:
-            return fstr + ": no commits"
-        if not self.show_renames:
-            return fstr
-        if fstr in names:
-            return " + ".join(names)
-        return fstr + ": " + " + ".join(names)
+    def _get_names_tuple(self) -> tuple[FileStr, ...]:
+        """Get the file names as a tuple, cached until a name is added."""
+        if self._names_tuple is None:
+            self._names_tuple = tuple(self._names)
+        return self._names_tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class IniRepo:
     """Initial repository configuration for analysis.
 
@@ -364,6 +474,44 @@ class IniRepo:
     args: object | None = None  # Args type not yet migrated
 
 
+@lru_cache(maxsize=4096)
+def format_names(
+    names: tuple[FileStr, ...], fstr: FileStr, subfolder: str, show_renames: bool
+) -> str:
+    """Format the names of a file for display, memoized across report rows.
+
+    Args:
+        names: All names of the file in order of first appearance
+        fstr: Primary file path string
+        subfolder: Subfolder to make the names relative to, empty for none
+        show_renames: Whether to show all names instead of the primary name
+
+    Returns:
+        Formatted file name string showing renames if enabled
+
+    """
+    if subfolder:
+        # Same as get_relative_fstr, with the subfolder length taken only once
+        n = len(subfolder)
+        rel_names = [
+            name[n:].removeprefix("/") if name.startswith(subfolder) else "/" + name
+            for name in names
+        ]
+        rel_fstr = (
+            fstr[n:].removeprefix("/") if fstr.startswith(subfolder) else "/" + fstr
+        )
+    else:
+        rel_names = list(names)
+        rel_fstr = fstr
+    if len(rel_names) == 0:
+        return rel_fstr + ": no commits"
+    if not show_renames:
+        return rel_fstr
+    if rel_fstr in rel_names:
+        return " + ".join(rel_names)
+    return rel_fstr + ": " + " + ".join(rel_names)
+
+
 def get_relative_fstr(fstr: str, subfolder: str) -> str:
     """Get relative file path string for a specific subfolder.
 
@@ -107,7 +107,7 @@ type FileRenameHistory = dict[FileStr, list[FileStr]]  # File rename tracking
 
 
 # Core dataclass definitions migrated from legacy system
-@dataclass
+@dataclass(slots=True)
 class CommitGroup:
     """Groups commits by author and file name."""
 
@@ -119,7 +119,7 @@ class CommitGroup:
     shas: set[SHA] = field(default_factory=set)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SHADateNr:
     """SHA with date and number for sorting."""
 
@@ -128,7 +128,7 @@ class SHADateNr:
     nr: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IniRepo:
     """Initial repository configuration."""
 
@@ -136,7 +136,7 @@ class IniRepo:
     location: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LineData:
     """Data for a single line in blame output."""
 
@@ -145,7 +145,7 @@ class LineData:
     is_empty: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Blame:
     """Blame information for a line of code."""
 
@@ -156,7 +156,7 @@ class Blame:
     line_data: LineData = field(default_factory=lambda: LineData())
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommentMarker:
     """Comment markers for different file types."""
 
@@ -165,7 +165,7 @@ class CommentMarker:
     line: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LocalHostData:
     """Data for localhost server configuration."""
 
@@ -174,7 +174,7 @@ class LocalHostData:
     browser_id: BrowserID
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RunnerQueues:
     """Queues for task processing."""
 
@@ -57,6 +57,21 @@ def test_advanced_filtering_patterns() -> None:
     print("✓ Advanced filtering patterns work correctly")
 
 
+def test_list_settings_defaults() -> None:
+    """Test that list settings default to fresh lists, also when passed as None."""
+    print("Testing list settings defaults...")
+
+    settings = Settings(input_fstrs=["test_repo"], ex_files=None, file_formats=None)
+    other = Settings(input_fstrs=["test_repo"])
+
+    assert settings.ex_files == []
+    assert settings.file_formats == ["html"]
+    assert "py" in settings.extensions
+    assert settings.ex_author_patterns is not other.ex_author_patterns
+
+    print("✓ List settings defaults work correctly")
+
+
 def test_performance_settings() -> None:
     """Test performance optimization settings."""
     print("Testing performance settings...")
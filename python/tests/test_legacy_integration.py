@@ -5,11 +5,20 @@ with the current API and can be used as a drop-in replacement.
 """
 
 import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 from gigui.api import GitInspectorAPI, Settings
-from gigui.core.legacy_engine import legacy_engine
+from gigui.common import validate_file_path
+from gigui.core.legacy_engine import (
+    VALID_PATH_TTL,
+    LegacyEngineWrapper,
+    legacy_engine,
+)
+from gigui.core.orchestrator import RepoData
+from tests.test_repository import commit_file, init_repo
 
 
 def test_legacy_engine_integration() -> None:
@@ -102,8 +111,220 @@ def test_settings_translation_compatibility() -> None:
             )
 
 
+def test_engine_info_returns_lists() -> None:
+    """Test that engine info holds lists that callers may change."""
+    info = legacy_engine.get_engine_info()
+    assert isinstance(info["capabilities"], list)
+
+    info["capabilities"].append("Extra")
+    info["api_integration"] = {}
+
+    info = legacy_engine.get_engine_info()
+    assert "Extra" not in info["capabilities"]
+    assert "api_integration" not in info
+
+
+def test_early_return_leaves_no_sampler_thread() -> None:
+    """Test that an analysis that returns early leaves no memory sampler running."""
+    result = legacy_engine.execute_analysis(
+        Settings(input_fstrs=["/nonexistent/repo"])
+    )
+
+    assert result.success is False
+    assert not any(
+        thread.name == "memory-sampler" and thread.is_alive()
+        for thread in threading.enumerate()
+    )
+
+
+def test_validation_reuses_recent_success(tmp_path: Path) -> None:
+    """Test that repeated validations skip the path check and translation."""
+    engine = LegacyEngineWrapper()
+    settings = Settings(input_fstrs=[str(tmp_path)])
+    assert engine.validate_settings(settings) == (True, "")
+
+    with (
+        patch("gigui.core.legacy_engine.validate_file_path") as mock_validate,
+        patch.object(
+            engine.settings_translator, "translate_to_legacy_args"
+        ) as mock_translate,
+    ):
+        assert engine.validate_settings(settings) == (True, "")
+        mock_validate.assert_not_called()
+        mock_translate.assert_not_called()
+
+
+def test_validation_rechecks_deleted_path(tmp_path: Path) -> None:
+    """Test that a path that was valid before fails after it is deleted."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    engine = LegacyEngineWrapper()
+    settings = Settings(input_fstrs=[str(repo)])
+    assert engine.validate_settings(settings) == (True, "")
+
+    repo.rmdir()
+    expired = time.monotonic() + VALID_PATH_TTL
+    with patch("gigui.core.legacy_engine.time.monotonic", return_value=expired):
+        is_valid, error_msg = engine.validate_settings(settings)
+    assert is_valid is False
+    assert "Path does not exist" in error_msg
+
+
+def test_analysis_reuses_validation(tmp_path: Path) -> None:
+    """Test that validate-then-execute checks paths and translates only once."""
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    commit_file(repo, "main.py", "a\n")
+    engine = LegacyEngineWrapper()
+    settings = Settings(input_fstrs=[str(repo)], extensions=["py"], n_files=10)
+
+    with (
+        patch(
+            "gigui.core.legacy_engine.validate_file_path",
+            wraps=validate_file_path,
+        ) as mock_validate,
+        patch.object(
+            engine.settings_translator,
+            "translate_to_legacy_args",
+            wraps=engine.settings_translator.translate_to_legacy_args,
+        ) as mock_translate,
+    ):
+        assert engine.validate_settings(settings) == (True, "")
+        result = engine.execute_analysis(settings)
+
+    assert result.success is True
+    mock_validate.assert_called_once_with(str(repo))
+    mock_translate.assert_called_once()
+
+
+def test_result_cache_hit_returns_shared_result(tmp_path: Path) -> None:
+    """Test that a repeated analysis reuses the cached result.
+
+    The first analysis, with a cold cache, does not inspect the repository.
+    """
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    commit_file(repo, "main.py", "a\nb\n")
+    engine = LegacyEngineWrapper()
+    settings = Settings(input_fstrs=[str(repo)], extensions=["py"], n_files=10)
+
+    with patch("gigui.core.legacy_engine.GitRepo") as mock_git_repo_class:
+        first = engine.execute_analysis(settings)
+        mock_git_repo_class.assert_not_called()
+    with patch("gigui.core.legacy_engine.RepoData") as mock_repo_data_class:
+        second = engine.execute_analysis(settings)
+        mock_repo_data_class.assert_not_called()
+
+    assert first.success is True
+    assert second is first
+
+
+def test_result_cache_miss_on_settings_files(tmp_path: Path) -> None:
+    """Test that date limits and ignore-revs file changes are not served cached."""
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    commit_file(repo, "main.py", "a\n")
+    engine = LegacyEngineWrapper()
+    dated = Settings(
+        input_fstrs=[str(repo)], extensions=["py"], n_files=10, since="2020-01-01"
+    )
+    ignore_revs = Settings(
+        input_fstrs=[str(repo)],
+        extensions=["py"],
+        n_files=10,
+        ignore_revs_file="revs.txt",
+    )
+    engine.execute_analysis(dated)
+    engine.execute_analysis(ignore_revs)
+    (repo / "revs.txt").write_text("0" * 40 + "\n")
+
+    with patch(
+        "gigui.core.legacy_engine.RepoData", wraps=RepoData
+    ) as mock_repo_data_class:
+        engine.execute_analysis(dated)
+        engine.execute_analysis(ignore_revs)
+
+    assert mock_repo_data_class.call_count == 2
+
+
+def test_result_cache_miss_on_repository_change(tmp_path: Path) -> None:
+    """Test that new commits and a changed mailmap invalidate cached results."""
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    commit_file(repo, "main.py", "a\n")
+    engine = LegacyEngineWrapper()
+    settings = Settings(input_fstrs=[str(repo)], extensions=["py"], n_files=10)
+    engine.execute_analysis(settings)
+
+    commit_file(repo, "main.py", "b\n", date="2024-01-02T12:00:00")
+    result = engine.execute_analysis(settings)
+    assert result.repositories[0].files[0].lines == 2
+
+    (repo / ".mailmap").write_text("Alice Smith <alice@example.com>\n")
+    result = engine.execute_analysis(settings)
+    assert [author.name for author in result.repositories[0].authors] == [
+        "Alice Smith"
+    ]
+
+
+def test_stream_translates_once(tmp_path: Path) -> None:
+    """Test that a streamed analysis translates and monitors all repos once."""
+    repo_paths = []
+    for name in ["first", "second"]:
+        repo = tmp_path / name
+        init_repo(repo)
+        commit_file(repo, "main.py", "a\n")
+        repo_paths.append(str(repo))
+    engine = LegacyEngineWrapper()
+    settings = Settings(input_fstrs=repo_paths, extensions=["py"], n_files=10)
+
+    with (
+        patch.object(
+            engine.settings_translator,
+            "translate_to_legacy_args",
+            wraps=engine.settings_translator.translate_to_legacy_args,
+        ) as mock_translate,
+        patch.object(
+            engine.performance_monitor,
+            "start_monitoring",
+            wraps=engine.performance_monitor.start_monitoring,
+        ) as mock_start,
+    ):
+        results = list(engine.execute_analysis_stream(settings))
+
+    assert [result.success for result in results] == [True, True]
+    assert [result.repositories[0].name for result in results] == [
+        "first",
+        "second",
+    ]
+    mock_translate.assert_called_once()
+    mock_start.assert_called_once()
+    assert not any(
+        thread.name == "memory-sampler" and thread.is_alive()
+        for thread in threading.enumerate()
+    )
+
+
+def test_stream_reports_translation_error(tmp_path: Path) -> None:
+    """Test that a failed translation is reported once, without extra prefix."""
+    engine = LegacyEngineWrapper()
+    settings = Settings(input_fstrs=[str(tmp_path)])
+
+    with patch.object(
+        engine.settings_translator,
+        "translate_to_legacy_args",
+        side_effect=ValueError("bad pattern"),
+    ):
+        results = list(engine.execute_analysis_stream(settings))
+
+    assert [result.error for result in results] == [
+        "Settings translation failed: bad pattern"
+    ]
+
+
 if __name__ == "__main__":
     test_legacy_engine_integration()
     test_legacy_engine_as_api_replacement()
     test_settings_translation_compatibility()
+    test_early_return_leaves_no_sampler_thread()
     print("✅ All integration tests passed!")
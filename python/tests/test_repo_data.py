@@ -89,6 +89,23 @@ def test_stat_tables() -> None:
     print("✓ StatTables tests passed")
 
 
+def test_persons_db_merge() -> None:
+    """Test that merged persons are reachable under all their keys."""
+    print("Testing PersonsDB merging...")
+
+    persons_db = PersonsDB()
+    persons_db.add_person("Alice Smith", "alice@example.com")
+    persons_db.add_person("Alice S", "alice2@example.com")
+    persons_db.add_person("Alice S", "alice@example.com")  # links both persons
+
+    person = persons_db["Alice Smith"]
+    for key in ["Alice S", "alice@example.com", "alice2@example.com"]:
+        assert persons_db[key] is person, f"{key} does not refer to merged person"
+    assert persons_db.authors == ["*", "Alice S"]
+
+    print("✓ PersonsDB merging tests passed")
+
+
 def test_repo_data_structure() -> None:
     """Test the RepoData class structure and initialization."""
     print("Testing RepoData class structure...")
@@ -0,0 +1,430 @@
+"""Tests for the git log parsing of RepoBase on small fixture repositories.
+
+Each test builds a throwaway git repository with fixed authors and dates, runs
+the base analysis on it and checks the resulting commit groups.
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from gigui.api.types import Settings
+from gigui.core.legacy_engine import LegacyEngineWrapper, SettingsTranslator
+from gigui.core.orchestrator import RepoData
+
+
+def git(repo: Path, *args: str, date: str = "2024-01-01T12:00:00") -> None:
+    """Run a git command in a fixture repository with a fixed commit date."""
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_DATE": date,
+        "GIT_COMMITTER_DATE": date,
+    }
+    subprocess.run(
+        ["git", *args], cwd=repo, env=env, check=True, capture_output=True
+    )
+
+
+def init_repo(repo: Path) -> None:
+    """Create an empty fixture repository with a fixed author."""
+    repo.mkdir(parents=True, exist_ok=True)
+    git(repo, "init", "-q", "-b", "main")
+    git(repo, "config", "user.name", "Alice")
+    git(repo, "config", "user.email", "alice@example.com")
+
+
+def append_file(repo: Path, fstr: str, text: str) -> None:
+    """Append text to a file of a fixture repository."""
+    path = repo / fstr
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as file:
+        file.write(text)
+
+
+def commit_all(
+    repo: Path, message: str, day: int, author: tuple[str, str] | None = None
+) -> None:
+    """Commit all changes of a fixture repository on a day of January 2024."""
+    identity = (
+        ["-c", f"user.name={author[0]}", "-c", f"user.email={author[1]}"]
+        if author
+        else []
+    )
+    git(repo, "add", "-A")
+    git(
+        repo,
+        *identity,
+        "commit",
+        "-q",
+        "-m",
+        message,
+        date=f"2024-01-{day:02d}T12:00:00",
+    )
+
+
+def commit_file(
+    repo: Path, fstr: str, text: str, date: str = "2024-01-01T12:00:00"
+) -> None:
+    """Append text to a file of a fixture repository and commit it."""
+    append_file(repo, fstr, text)
+    git(repo, "add", "--", fstr)
+    git(repo, "commit", "-q", "-m", f"Change {fstr}", date=date)
+
+
+def analyze(repo: Path, **settings_kwargs: Any) -> RepoData:
+    """Run the base analysis on a fixture repository."""
+    settings = Settings(
+        input_fstrs=[str(repo)], extensions=["py"], n_files=100, **settings_kwargs
+    )
+    return RepoData(SettingsTranslator().translate_to_legacy_args(settings))
+
+
+BJORN = ("Björn Ström", "bjorn@example.com")
+BOB = ("Bob", "bob@example.com")
+
+# Subjects of the commits of the history repository, oldest first
+HISTORY_SUBJECTS = [
+    "Add a and b",
+    "Extend a",
+    "Rename a to moved",
+    "New a",
+    "Add n",
+    "Rename n",
+    "Feature b",
+    "Add c",
+    "Merge feature",
+    "After merge",
+]
+
+
+@pytest.fixture(scope="module")
+def history_repo(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, dict]:
+    """Create a repository with renames, a reused file name and a merge.
+
+    a.py is renamed to moved.py, after which a new a.py is added, so that both
+    files share the history of the old a.py. de/n.py is renamed to de/new.py.
+    The feature branch changes b.py and is merged with a merge commit.
+
+    Returns:
+        Tuple of (repository path, dictionary mapping commit subjects to shas)
+
+    """
+    repo = tmp_path_factory.mktemp("history") / "repo"
+    init_repo(repo)
+    append_file(repo, "a.py", "a1\na2\na3\n")
+    append_file(repo, "b.py", "b1\n")
+    commit_all(repo, "Add a and b", 1)
+    append_file(repo, "a.py", "a4\n")
+    commit_all(repo, "Extend a", 2, BJORN)
+    git(repo, "mv", "a.py", "moved.py")
+    append_file(repo, "moved.py", "m1\n")
+    commit_all(repo, "Rename a to moved", 3)
+    append_file(repo, "a.py", "new1\nnew2\n")
+    commit_all(repo, "New a", 4)
+    append_file(repo, "de/n.py", "x1\nx2\n")
+    commit_all(repo, "Add n", 5)
+    git(repo, "mv", "de/n.py", "de/new.py")
+    append_file(repo, "de/new.py", "x3\n")
+    commit_all(repo, "Rename n", 6, BJORN)
+    git(repo, "checkout", "-q", "-b", "feature")
+    append_file(repo, "b.py", "b2\n")
+    commit_all(repo, "Feature b", 7, BOB)
+    git(repo, "checkout", "-q", "main")
+    append_file(repo, "c.py", "c1\n")
+    commit_all(repo, "Add c", 8)
+    git(
+        repo,
+        "merge",
+        "-q",
+        "--no-ff",
+        "feature",
+        "-m",
+        "Merge feature",
+        date="2024-01-09T12:00:00",
+    )
+    append_file(repo, "b.py", "b3\n")
+    commit_all(repo, "After merge", 10)
+
+    log = subprocess.run(
+        ["git", "log", "--format=%h %s"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    sha_subjects = (line.split(" ", 1) for line in log.splitlines())
+    return repo, {subject: sha for sha, subject in sha_subjects}
+
+
+def commit_summary(repo_data: RepoData) -> dict[str, list[tuple[str, int, int]]]:
+    """Get (fstr, insertions, number of shas) of each commit group per file."""
+    return {
+        fstr: [
+            (group.fstr, group.insertions, len(group.shas)) for group in groups
+        ]
+        for fstr, groups in repo_data.fstr2commit_groups.items()
+    }
+
+
+def test_non_ascii_file_names(tmp_path: Path) -> None:
+    """Test that files with non-ASCII or tab characters keep their commits."""
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    commit_file(repo, "café.py", "a\nb\n")
+    commit_file(repo, "tab\tname.py", "x\n")
+    commit_file(repo, "café.py", "c\n", date="2024-01-02T12:00:00")
+
+    summary = commit_summary(analyze(repo))
+
+    assert summary["café.py"] == [("café.py", 3, 2)]
+    assert summary["tab\tname.py"] == [("tab\tname.py", 1, 1)]
+
+
+def test_non_ascii_rename(tmp_path: Path) -> None:
+    """Test that a renamed file with non-ASCII characters keeps both names."""
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    commit_file(repo, "dé/ñ.py", "a\nb\n")
+    git(repo, "mv", "dé/ñ.py", "dé/ñew.py")
+    commit_file(repo, "dé/ñew.py", "c\n", date="2024-01-02T12:00:00")
+
+    repo_data = analyze(repo)
+
+    assert commit_summary(repo_data)["dé/ñew.py"] == [
+        ("dé/ñew.py", 1, 1),
+        ("dé/ñ.py", 2, 1),
+    ]
+    shas = sorted(repo_data.sha2nr, key=repo_data.sha2nr.__getitem__)
+    assert [repo_data.get_fstr_for_sha("dé/ñew.py", sha) for sha in shas] == [
+        "dé/ñ.py",
+        "dé/ñew.py",
+    ]
+
+
+def test_merge_commits(tmp_path: Path) -> None:
+    """Test that merges keep the commits of both branches and add no group."""
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    commit_file(repo, "main.py", "a\n")
+    git(repo, "checkout", "-q", "-b", "feature")
+    commit_file(repo, "feature.py", "f\n", date="2024-01-02T12:00:00")
+    git(repo, "checkout", "-q", "main")
+    commit_file(repo, "main.py", "b\n", date="2024-01-03T12:00:00")
+    git(repo, "merge", "-q", "--no-ff", "feature", "-m", "Merge feature")
+
+    summary = commit_summary(analyze(repo))
+
+    assert summary["main.py"] == [("main.py", 2, 2)]
+    assert summary["feature.py"] == [("feature.py", 1, 1)]
+
+
+def test_first_pass_numbers_commits(history_repo: tuple[Path, dict]) -> None:
+    """Test that all commits, merges included, are numbered from old to new."""
+    repo, subject2sha = history_repo
+
+    repo_data = analyze(repo)
+
+    assert repo_data.sha2nr == {
+        subject2sha[subject]: nr for nr, subject in enumerate(HISTORY_SUBJECTS, 1)
+    }
+    assert sorted(
+        (person.author, sorted(person.emails))
+        for person in repo_data.persons_db.persons
+    ) == [
+        ("*", ["*"]),
+        ("Alice", ["alice@example.com"]),
+        ("Björn Ström", ["bjorn@example.com"]),
+        ("Bob", ["bob@example.com"]),
+    ]
+
+
+def test_first_pass_excludes_messages(history_repo: tuple[Path, dict]) -> None:
+    """Test that commits with excluded messages are left out of the groups."""
+    repo, subject2sha = history_repo
+
+    repo_data = analyze(repo, ex_messages=["feature*"])
+
+    assert repo_data.ex_shas == {subject2sha["Feature b"]}
+    assert [group.author for group in repo_data.fstr2commit_groups["b.py"]] == [
+        "Alice"
+    ]
+
+
+@pytest.mark.parametrize("multithread", [False, True])
+def test_shared_history_is_counted_once(
+    history_repo: tuple[Path, dict], multithread: bool
+) -> None:
+    """Test that files sharing the history of a reused name do not both count it.
+
+    moved.py follows a.py back through its rename, and the new a.py has the
+    history of the old a.py as well. The shared tail is kept only for a.py.
+    """
+    repo, subject2sha = history_repo
+    sha2subject = {sha: subject for subject, sha in subject2sha.items()}
+
+    repo_data = analyze(repo, multithread=multithread)
+
+    assert {
+        fstr: [
+            (
+                group.fstr,
+                group.author,
+                group.insertions,
+                sorted(sha2subject[sha] for sha in group.shas),
+            )
+            for group in groups
+        ]
+        for fstr, groups in repo_data.fstr2commit_groups.items()
+    } == {
+        "moved.py": [("moved.py", "Alice", 1, ["Rename a to moved"])],
+        "b.py": [
+            ("b.py", "Alice", 1, ["After merge"]),
+            ("b.py", "Bob", 1, ["Feature b"]),
+            ("b.py", "Alice", 1, ["Add a and b"]),
+        ],
+        "de/new.py": [
+            ("de/new.py", "Björn Ström", 1, ["Rename n"]),
+            ("de/n.py", "Alice", 2, ["Add n"]),
+        ],
+        "a.py": [
+            ("a.py", "Alice", 2, ["New a", "Rename a to moved"]),
+            ("a.py", "Björn Ström", 1, ["Extend a"]),
+            ("a.py", "Alice", 3, ["Add a and b"]),
+        ],
+        "c.py": [("c.py", "Alice", 1, ["Add c"])],
+    }
+
+
+def test_file_names_per_commit(history_repo: tuple[Path, dict]) -> None:
+    """Test the name of renamed files at each commit, before their addition too."""
+    repo, subject2sha = history_repo
+
+    repo_data = analyze(repo)
+
+    def names(fstr: str) -> list[str]:
+        return [
+            repo_data.get_fstr_for_sha(fstr, subject2sha[subject])
+            for subject in HISTORY_SUBJECTS
+        ]
+
+    assert names("moved.py") == ["a.py", "a.py"] + ["moved.py"] * 8
+    assert names("de/new.py") == [""] * 4 + ["de/n.py"] + ["de/new.py"] * 5
+
+
+def test_bulk_log_matches_follow_on_merges(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that chunked git log gives the commits of per-file --follow calls.
+
+    The merges keep one side of a file and drop the other, which git log prunes
+    for a pathspec that is TREESAME to a parent unless the full history is used.
+    """
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    for fstr in ["a.py", "b.py", "c.py"]:
+        append_file(repo, fstr, f"{fstr}1\n")
+    commit_all(repo, "Base", 1)
+    git(repo, "branch", "feature")
+    git(repo, "branch", "dropped")
+    append_file(repo, "a.py", "main\n")
+    commit_all(repo, "Main a", 2)
+
+    git(repo, "checkout", "-q", "feature")
+    append_file(repo, "a.py", "feature\n")
+    commit_all(repo, "Feature a", 3, BOB)
+    append_file(repo, "b.py", "feature\n")
+    commit_all(repo, "Feature b", 4, BOB)
+    git(repo, "checkout", "-q", "main")
+    # Keep a.py of main and b.py of feature
+    subprocess.run(
+        ["git", "merge", "-q", "feature", "-m", "Merge feature"],
+        cwd=repo,
+        capture_output=True,
+    )
+    git(repo, "checkout", "--ours", "a.py")
+    commit_all(repo, "Merge feature", 5)
+
+    git(repo, "checkout", "-q", "dropped")
+    append_file(repo, "c.py", "dropped\n")
+    commit_all(repo, "Dropped c", 6, BJORN)
+    git(repo, "checkout", "-q", "main")
+    git(repo, "merge", "-q", "-s", "ours", "dropped", "-m", "Merge dropped")
+    append_file(repo, "c.py", "main\n")
+    commit_all(repo, "Main c", 7)
+
+    bulk = commit_summary(analyze(repo))
+    get_renamed_fstrs = RepoData._get_renamed_fstrs
+    monkeypatch.setattr(
+        RepoData,
+        "_get_renamed_fstrs",
+        lambda self: get_renamed_fstrs(self) | set(self.fstrs),
+    )
+    follow = commit_summary(analyze(repo))
+
+    assert bulk == follow
+    # Main c, Dropped c and Base, the dropped branch is not pruned
+    assert bulk["c.py"] == [("c.py", 1, 1), ("c.py", 1, 1), ("c.py", 1, 1)]
+
+
+def test_renames_within_date_range(history_repo: tuple[Path, dict]) -> None:
+    """Test that renames before since are left out of the rename map.
+
+    Files keep their name from before since for commits outside the range.
+    """
+    repo, subject2sha = history_repo
+
+    repo_data = analyze(repo, since="2024-01-06T00:00:00")
+
+    # moved.py was renamed on January 3 and de/n.py on January 6
+    assert repo_data._get_renamed_fstrs() == {"de/new.py"}
+    assert commit_summary(repo_data)["moved.py"] == []
+    assert [
+        repo_data.get_fstr_for_sha(fstr, subject2sha[subject])
+        for fstr, subject in [
+            ("moved.py", "Add n"),
+            ("moved.py", "After merge"),
+            ("de/new.py", "Add n"),
+            ("de/new.py", "Rename n"),
+        ]
+    ] == ["moved.py", "moved.py", "de/n.py", "de/new.py"]
+    # Files without commits since are still blamed at HEAD
+    assert {"a.py", "moved.py", "de/new.py"} <= set(repo_data.fstr2blames)
+
+
+def test_empty_repository(tmp_path: Path) -> None:
+    """Test that a repository without commits is reported as an error."""
+    repo = tmp_path / "repo"
+    init_repo(repo)
+
+    result = LegacyEngineWrapper().execute_analysis(
+        Settings(input_fstrs=[str(repo)], extensions=["py"])
+    )
+
+    assert result.success is False
+    assert result.repositories == []
+
+
+def test_line_counts(tmp_path: Path) -> None:
+    """Test that lines are counted as text.split("\\n") on UTF-8 blobs."""
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    (repo / "a_binary.py").write_bytes(b"\xff\xfe\n" * 10)
+    (repo / "b_empty.py").write_text("")
+    append_file(repo, "c_newline.py", "a\nb\n")
+    append_file(repo, "d_no_newline.py", "a\nb")
+    commit_all(repo, "Add files", 1)
+
+    repo_data = analyze(repo)
+
+    assert {
+        fstr: repo_data.fstr2line_count.get(fstr)
+        for fstr in ["a_binary.py", "b_empty.py", "c_newline.py", "d_no_newline.py"]
+    } == {
+        "a_binary.py": 0,
+        "b_empty.py": 1,
+        "c_newline.py": 3,
+        "d_no_newline.py": 2,
+    }